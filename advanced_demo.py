@@ -338,7 +338,7 @@ def demo_alternative_data():
         )
         if insider_data:
             print(f"  • Recent transactions: {len(insider_data)}")
-            for transaction in insider_data[:2]:  # Show first 2
+            for transaction in insider_data.to_records()[:2]:  # Show first 2
                 print(
                     f"    - {transaction.insider_name} ({transaction.title}): "
                     f"{transaction.transaction_type} {transaction.shares_transacted:,.0f} shares"
@@ -31,13 +31,11 @@ fileConfig(config.config_file_name)
 # ---------------------------------------------------------------------------
 # Import project models & gather metadata
 # ---------------------------------------------------------------------------
-from src.auth.models import (
-    Base as AuthBase,
-)  # noqa: E402  pylint: disable=wrong-import-position
+from src.db import Base  # noqa: E402  pylint: disable=wrong-import-position
 
-# All models share the same MetaData because they inherit from the same Base
-# class, so we can safely pick one of them.
-target_metadata = AuthBase.metadata  # same object as ProjectBase.metadata
+# Importing src.db registers the auth and domain models on the one shared Base,
+# so autogenerate sees every table.
+target_metadata = Base.metadata
 
 
 # ---------------------------------------------------------------------------
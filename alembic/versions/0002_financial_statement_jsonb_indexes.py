@@ -0,0 +1,58 @@
+"""financial statement jsonb indexes
+
+Revision ID: 0002_fin_stmt_jsonb_indexes
+Revises: 0001_create_core_tables
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_fin_stmt_jsonb_indexes"
+down_revision = "0001_create_core_tables"
+branch_labels = None
+depends_on = None
+
+# Expression indexes on the scalar metrics read by range / order queries
+METRIC_INDEXES = {
+    "ix_fin_stmt_net_income": "net_income",
+    "ix_fin_stmt_revenue": "revenue",
+}
+
+
+def upgrade() -> None:
+    # JSONB operators and indexes are Postgres-only; SQLite keeps plain JSON
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        "ALTER TABLE financial_statement "
+        "ALTER COLUMN data TYPE jsonb USING data::jsonb"
+    )
+
+    # CONCURRENTLY cannot run inside the migration transaction, and builds
+    # the indexes without blocking writes to the table
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_fin_stmt_data_path "
+            "ON financial_statement USING gin (data jsonb_path_ops)"
+        )
+        for name, key in METRIC_INDEXES.items():
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON financial_statement (((data->>'{key}')::numeric))"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        for name in [*METRIC_INDEXES, "ix_fin_stmt_data_path"]:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+    op.execute(
+        "ALTER TABLE financial_statement ALTER COLUMN data TYPE json USING data::json"
+    )
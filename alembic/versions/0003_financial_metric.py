@@ -0,0 +1,79 @@
+"""financial metric table
+
+Revision ID: 0003_financial_metric
+Revises: 0002_fin_stmt_jsonb_indexes
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003_financial_metric"
+down_revision = "0002_fin_stmt_jsonb_indexes"
+branch_labels = None
+depends_on = None
+
+# Flatten the numeric fields of existing statements; new ones are kept in
+# step by the FinancialStatement flush hook
+BACKFILL = {
+    "postgresql": """
+        INSERT INTO financial_metric
+            (statement_id, company_id, fiscal_year, fiscal_quarter, metric_name, value)
+        SELECT fs.id, fs.company_id, fs.fiscal_year, fs.fiscal_quarter,
+               kv.key, (kv.value #>> '{}')::double precision
+        FROM financial_statement fs, jsonb_each(fs.data::jsonb) AS kv
+        WHERE jsonb_typeof(kv.value) = 'number'
+    """,
+    "sqlite": """
+        INSERT INTO financial_metric
+            (statement_id, company_id, fiscal_year, fiscal_quarter, metric_name, value)
+        SELECT fs.id, fs.company_id, fs.fiscal_year, fs.fiscal_quarter,
+               kv.key, kv.value
+        FROM financial_statement fs, json_each(fs.data) AS kv
+        WHERE kv.type IN ('integer', 'real')
+    """,
+}
+
+
+def upgrade() -> None:
+    op.create_table(
+        "financial_metric",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column(
+            "statement_id",
+            sa.Integer(),
+            sa.ForeignKey("financial_statement.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "company_id",
+            sa.Integer(),
+            sa.ForeignKey("company_profile.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("fiscal_year", sa.Integer(), nullable=False),
+        sa.Column("fiscal_quarter", sa.Integer()),
+        sa.Column("metric_name", sa.String(length=64), nullable=False),
+        sa.Column("value", sa.Float(), nullable=False),
+    )
+    op.create_index(
+        "ix_fm_lookup",
+        "financial_metric",
+        ["company_id", "metric_name", "fiscal_year"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_fm_statement", "financial_metric", ["statement_id"], unique=False
+    )
+
+    backfill = BACKFILL.get(op.get_bind().dialect.name)
+    if backfill:
+        op.execute(backfill)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_fm_statement", table_name="financial_metric")
+    op.drop_index("ix_fm_lookup", table_name="financial_metric")
+    op.drop_table("financial_metric")
@@ -0,0 +1,42 @@
+"""market data covering index
+
+Revision ID: 0004_market_data_covering_index
+Revises: 0003_financial_metric
+Create Date: 2026-10-16
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_market_data_covering_index"
+down_revision = "0003_financial_metric"
+branch_labels = None
+depends_on = None
+
+
+def _rebuild_index(include: str) -> None:
+    """Swap ix_market_data_company_date for a rebuilt copy without blocking writes"""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY ix_market_data_company_date_new "
+            f"ON market_data (company_id, date){include}"
+        )
+        op.execute("DROP INDEX CONCURRENTLY ix_market_data_company_date")
+        op.execute(
+            "ALTER INDEX ix_market_data_company_date_new "
+            "RENAME TO ix_market_data_company_date"
+        )
+
+
+def upgrade() -> None:
+    # INCLUDE columns are Postgres-only; other backends keep the plain index
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _rebuild_index(" INCLUDE (price)")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    _rebuild_index("")
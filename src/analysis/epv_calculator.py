@@ -6,7 +6,9 @@ Core valuation engine based on Bruce Greenwald's approach
 import numpy as np
 from typing import Dict, List, Optional, Tuple
 from datetime import date
+import hashlib
 import logging
+import pickle
 import threading
 from dataclasses import dataclass, field
 
@@ -20,6 +22,71 @@ from src.models.financial_models import (
 )
 from src.config.config import config
 
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _earnings_kernel(
+    net_incomes: np.ndarray, operating_incomes: np.ndarray
+) -> Tuple[float, bool]:
+    """
+    Normalized earnings from non-zero net and operating incomes, newest first.
+
+    Returns (normalized earnings, fell back), where the flag marks the very
+    conservative fallback used when the blended estimate is not positive.
+    """
+    n = net_incomes.size
+
+    # Method 1: Simple average of net income (last 5-10 years)
+    avg_net_income = net_incomes.mean() if n else 0.0
+
+    # Method 2: Weighted average (more weight to recent years)
+    if n >= 3:
+        weights = np.linspace(1.0, 0.5, n)
+        weights = weights / weights.sum()
+        weighted_avg = (net_incomes * weights).sum() / weights.sum()
+    else:
+        weighted_avg = avg_net_income
+
+    # Method 3: Median earnings (removes outliers)
+    median_earnings = np.median(net_incomes) if n else 0.0
+
+    # Method 4: Operating income based (more stable)
+    avg_operating_income = operating_incomes.mean() if operating_incomes.size else 0.0
+
+    # Combine methods with weights
+    # Prefer operating income for industrial companies, net income for financials
+    if avg_operating_income > 0:
+        # Use 60% operating income, 40% net income approach
+        normalized_earnings = (0.6 * avg_operating_income * 0.7) + (0.4 * weighted_avg)
+    else:
+        # Fall back to net income approaches
+        normalized_earnings = (0.6 * weighted_avg) + (0.4 * median_earnings)
+
+    # Apply conservatism factor (reduce by 10% for safety)
+    normalized_earnings *= 0.9
+
+    # Ensure positive earnings (EPV not applicable to loss-making companies)
+    if normalized_earnings <= 0:
+        return max(avg_net_income, 0.0) * 0.5, True  # Very conservative
+    return normalized_earnings, False
+
+
+if NUMBA_AVAILABLE:
+    _normalized_earnings_kernel = njit(cache=True)(_earnings_kernel)
+else:
+    _normalized_earnings_kernel = _earnings_kernel
+
+
+def _input_digest(*inputs) -> str:
+    """Content hash of EPV inputs, so memoised results track the data they used"""
+    payload = pickle.dumps(inputs, protocol=pickle.HIGHEST_PROTOCOL)
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
 
 class EPVCalculator:
     """
@@ -30,7 +97,8 @@ class EPVCalculator:
     EPV = Normalized Earnings / Cost of Capital
     """
 
-    _cache: Dict[str, EPVCalculation] = {}
+    # Latest (input digest, result) per symbol
+    _cache: Dict[str, Tuple[str, EPVCalculation]] = {}
     _lock = threading.Lock()
 
     def __init__(self):
@@ -64,9 +132,18 @@ class EPVCalculator:
             EPVCalculation object with detailed results
         """
 
-        # Memoization – only compute once per symbol per process
-        if symbol in self._cache:
-            return self._cache[symbol]
+        # Memoization – recompute only when the inputs for a symbol change
+        digest = _input_digest(
+            income_statements,
+            balance_sheets,
+            cash_flow_statements,
+            financial_ratios,
+            current_price,
+            company_profile,
+        )
+        cached = self._cache.get(symbol)
+        if cached is not None and cached[0] == digest:
+            return cached[1]
 
         self.logger.info(f"Calculating EPV for {symbol}")
 
@@ -129,7 +206,7 @@ class EPVCalculator:
 
             # store in cache thread-safely
             with self._lock:
-                self._cache[symbol] = epv_calculation
+                self._cache[symbol] = (digest, epv_calculation)
 
             return epv_calculation
 
@@ -171,47 +248,21 @@ class EPVCalculator:
         # Sort by year (most recent first)
         earnings_data.sort(key=lambda x: x["year"], reverse=True)
 
-        # Method 1: Simple average of net income (last 5-10 years)
-        net_incomes = [e["net_income"] for e in earnings_data if e["net_income"]]
-        avg_net_income = np.mean(net_incomes) if net_incomes else 0
-
-        # Method 2: Weighted average (more weight to recent years)
-        if len(net_incomes) >= 3:
-            weights = np.linspace(1, 0.5, len(net_incomes))
-            weights = weights / weights.sum()
-            weighted_avg = np.average(net_incomes, weights=weights)
-        else:
-            weighted_avg = avg_net_income
-
-        # Method 3: Median earnings (removes outliers)
-        median_earnings = np.median(net_incomes) if net_incomes else 0
-
-        # Method 4: Operating income based (more stable)
-        operating_incomes = [
-            e["operating_income"] for e in earnings_data if e["operating_income"]
-        ]
-        avg_operating_income = np.mean(operating_incomes) if operating_incomes else 0
-
-        # Combine methods with weights
-        # Prefer operating income for industrial companies, net income for financials
-        if avg_operating_income > 0:
-            # Use 60% operating income, 40% net income approach
-            normalized_earnings = (0.6 * avg_operating_income * 0.7) + (
-                0.4 * weighted_avg
-            )
-        else:
-            # Fall back to net income approaches
-            normalized_earnings = (0.6 * weighted_avg) + (0.4 * median_earnings)
-
-        # Apply conservatism factor (reduce by 10% for safety)
-        normalized_earnings *= 0.9
-
-        # Ensure positive earnings (EPV not applicable to loss-making companies)
-        if normalized_earnings <= 0:
+        net_incomes = np.array(
+            [e["net_income"] for e in earnings_data if e["net_income"]],
+            dtype=np.float64,
+        )
+        operating_incomes = np.array(
+            [e["operating_income"] for e in earnings_data if e["operating_income"]],
+            dtype=np.float64,
+        )
+        normalized_earnings, fell_back = _normalized_earnings_kernel(
+            net_incomes, operating_incomes
+        )
+        if fell_back:
             self.logger.warning("Normalized earnings are negative or zero")
-            normalized_earnings = max(avg_net_income, 0) * 0.5  # Very conservative
 
-        return normalized_earnings
+        return float(normalized_earnings)
 
     def _get_current_shares_outstanding(
         self, income_statements: List[IncomeStatement]
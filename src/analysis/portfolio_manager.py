@@ -13,7 +13,7 @@ import warnings
 
 warnings.filterwarnings("ignore")
 
-from src.models.financial_models import MarketData, PortfolioPosition
+from src.models.financial_models import MarketData, PortfolioArray, PortfolioPosition
 
 # mypy: ignore-errors
 
@@ -239,12 +239,9 @@ class PortfolioManager:
 
         try:
             # Calculate portfolio value and weights
-            total_value = sum(pos.market_value for pos in positions)
-            weights = (
-                [pos.market_value / total_value for pos in positions]
-                if total_value > 0
-                else []
-            )
+            holdings = PortfolioArray.from_positions(positions)
+            total_value = float(holdings.market_value.sum())
+            weights = holdings.weights()
 
             # Calculate returns
             portfolio_returns = self._calculate_portfolio_returns(
@@ -306,21 +303,14 @@ class PortfolioManager:
             )
 
             # EPV-specific metrics
-            weighted_epv = sum(
-                pos.epv_per_share * weight for pos, weight in zip(positions, weights)
-            )
-            weighted_margin_of_safety = sum(
-                pos.epv_margin_of_safety * weight
-                for pos, weight in zip(positions, weights)
-            )
+            weighted_epv = float(holdings.epv_per_share @ weights)
+            weighted_margin_of_safety = float(holdings.epv_margin_of_safety @ weights)
 
             # Quality score (would need to be passed in or calculated)
             weighted_quality_score = 0.7  # Placeholder
 
             # EPV to market ratio
-            weighted_market_price = sum(
-                pos.current_price * weight for pos, weight in zip(positions, weights)
-            )
+            weighted_market_price = float(holdings.current_price @ weights)
             epv_to_market_ratio = (
                 weighted_epv / weighted_market_price if weighted_market_price > 0 else 0
             )
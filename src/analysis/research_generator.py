@@ -5,8 +5,12 @@ Creates comprehensive investment research reports with EPV analysis
 
 from typing import Dict, List, Optional, Tuple
 from datetime import date
+import csv
+import io
 import logging
 
+import orjson
+
 from src.models.financial_models import (
     ResearchReport,
     EPVCalculation,
@@ -16,6 +20,19 @@ from src.data.data_collector import DataCollector
 from src.analysis.epv_calculator import EPVCalculator
 from src.utils.cache_manager import CacheManager
 
+REPORT_EXPORT_COLUMNS = [
+    "Symbol",
+    "Company",
+    "EPV_Per_Share",
+    "Current_Price",
+    "Margin_of_Safety",
+    "Quality_Score",
+    "Risk_Score",
+    "Recommendation",
+    "Target_Price",
+    "Confidence_Level",
+]
+
 
 class ResearchGenerator:
     """
@@ -63,7 +80,7 @@ class ResearchGenerator:
                 raise ValueError(f"Could not retrieve company profile for {symbol}")
 
             # Step 2: Calculate EPV
-            current_price = self._get_current_price(company_data["market_data"])
+            current_price = company_data["current_price"]
             epv_calculation = self.epv_calculator.calculate_epv(
                 symbol=symbol,
                 income_statements=company_data["income_statements"],
@@ -140,13 +157,6 @@ class ResearchGenerator:
             self.logger.error(f"Error generating research report for {symbol}: {e}")
             raise
 
-    def _get_current_price(self, market_data: List[MarketData]) -> Optional[float]:
-        """Get most recent stock price"""
-        if market_data:
-            latest_data = max(market_data, key=lambda x: x.date)
-            return latest_data.price
-        return None
-
     def _create_current_market_data(
         self, symbol: str, price: Optional[float]
     ) -> Optional[MarketData]:
@@ -508,8 +518,8 @@ class ResearchGenerator:
         # Cap between 0.3 and 0.95
         return max(0.3, min(0.95, confidence))
 
-    def export_report(self, report: ResearchReport, format: str = "json") -> str:
-        """Export research report to specified format"""
+    def export_report(self, report: ResearchReport, format: str = "json") -> bytes:
+        """Export research report to specified format, as UTF-8 bytes"""
 
         if format.lower() == "json":
             return self._export_json(report)
@@ -518,46 +528,35 @@ class ResearchGenerator:
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
-    def _export_json(self, report: ResearchReport) -> str:
+    def _export_json(self, report: ResearchReport) -> bytes:
         """Export report as JSON"""
-        import json
-        from dataclasses import asdict
-
-        # Convert dataclasses to dict, handling datetime objects
-        def serialize_datetime(obj):
-            if isinstance(obj, (datetime, date)):
-                return obj.isoformat()
-            raise TypeError(f"Object {obj} is not JSON serializable")
-
-        report_dict = asdict(report)
-        return json.dumps(report_dict, indent=2, default=serialize_datetime)
+        # orjson serializes the dataclasses and dates directly, without an
+        # intermediate asdict() copy of the whole report
+        return orjson.dumps(
+            report,
+            option=orjson.OPT_INDENT_2
+            | orjson.OPT_SERIALIZE_NUMPY
+            | orjson.OPT_NON_STR_KEYS,
+        )
 
-    def _export_csv(self, report: ResearchReport) -> str:
+    def _export_csv(self, report: ResearchReport) -> bytes:
         """Export key metrics as CSV"""
-
-        # Create summary metrics DataFrame
-        data = {
-            "Symbol": [report.symbol],
-            "Company": [report.company_name],
-            "EPV_Per_Share": [
-                report.epv_calculation.epv_per_share if report.epv_calculation else None
-            ],
-            "Current_Price": [
-                report.epv_calculation.current_price if report.epv_calculation else None
-            ],
-            "Margin_of_Safety": [
-                (
-                    report.epv_calculation.margin_of_safety
-                    if report.epv_calculation
-                    else None
-                )
-            ],
-            "Quality_Score": [report.quality_score],
-            "Risk_Score": [report.risk_score],
-            "Recommendation": [report.recommendation],
-            "Target_Price": [report.target_price],
-            "Confidence_Level": [report.confidence_level],
-        }
-
-        df = pd.DataFrame(data)
-        return df.to_csv(index=False)
+        epv = report.epv_calculation
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(REPORT_EXPORT_COLUMNS)
+        writer.writerow(
+            [
+                report.symbol,
+                report.company_name,
+                epv.epv_per_share if epv else None,
+                epv.current_price if epv else None,
+                epv.margin_of_safety if epv else None,
+                report.quality_score,
+                report.risk_score,
+                report.recommendation,
+                report.target_price,
+                report.confidence_level,
+            ]
+        )
+        return buffer.getvalue().encode("utf-8")
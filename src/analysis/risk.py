@@ -3,38 +3,122 @@ Risk analysis calculations for financial portfolios
 """
 
 import numpy as np
-from typing import List, Dict
+from functools import lru_cache
+from typing import List, Dict, Tuple, Union
 
+try:
+    from numba import njit, types
 
-def calc_risk(prices: List[float]) -> Dict[str, float]:
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _lower_quantile(values: np.ndarray, q: float) -> float:
+    """
+    Return the ``q`` quantile of ``values`` using the "lower" method.
+
+    Equivalent to ``np.quantile(values, q, method="lower")`` but selects the
+    k-th smallest element with ``np.partition`` (O(N)) instead of sorting.
+    """
+    k = int(q * (values.size - 1))
+    return float(np.partition(values, k)[k])
+
+
+def _fused_risk_stats(prices: np.ndarray) -> Tuple[float, float, float]:
+    """
+    Single pass over ``prices`` producing (VaR99, Sharpe, mean return).
+
+    Returns are computed on the fly and folded into Welford's running
+    mean/variance, so the series is swept once instead of once per statistic.
+    The returns buffer is only kept for the VaR99 order statistic.
+    """
+    n = prices.size - 1
+    returns = np.empty(n)
+    mean = 0.0
+    m2 = 0.0
+    for i in range(n):
+        r = (prices[i + 1] - prices[i]) / prices[i]
+        returns[i] = r
+        delta = r - mean
+        mean += delta / (i + 1)
+        m2 += delta * (r - mean)
+
+    k = int(0.01 * (n - 1))
+    var99 = np.partition(returns, k)[k]
+
+    std = np.sqrt(m2 / (n - 1)) if n > 1 else 0.0
+    sharpe = mean / std if std != 0.0 else 0.0
+    return var99, sharpe, mean
+
+
+def _numpy_risk_stats(prices: np.ndarray) -> Tuple[float, float, float]:
+    """Vectorised NumPy equivalent of ``_fused_risk_stats`` (no Numba)."""
+    returns = np.diff(prices) / prices[:-1]
+    var99 = _lower_quantile(returns, 0.01)
+    mean_return = np.mean(returns)
+    std_return = np.std(returns, ddof=1) if len(returns) > 1 else 0.0
+    sharpe = mean_return / std_return if std_return != 0 else 0.0
+    return var99, sharpe, mean_return
+
+
+if NUMBA_AVAILABLE:
+    # Explicit signatures so compilation (or cache load) happens at import time;
+    # the read-only variant accepts arrays backed by bytes (np.frombuffer).
+    # nogil lets concurrent requests run the kernel in parallel threads.
+    _RISK_STATS_RESULT = types.UniTuple(types.float64, 3)
+    _risk_stats = njit(
+        [
+            _RISK_STATS_RESULT(types.Array(types.float64, 1, "C")),
+            _RISK_STATS_RESULT(types.Array(types.float64, 1, "C", readonly=True)),
+        ],
+        cache=True,
+        nogil=True,
+        error_model="numpy",
+    )(_fused_risk_stats)
+else:
+    _risk_stats = _numpy_risk_stats
+
+
+def warm_up_risk_kernel() -> None:
+    """
+    Run the risk kernel once on a dummy series so any JIT work is paid at
+    startup rather than on the first ``/risk/metrics`` request.
+    """
+    _risk_stats(np.ones(4, dtype=np.float64))
+
+
+@lru_cache(maxsize=256)
+def _cached_risk_stats(key: bytes) -> Tuple[float, float, float]:
+    """Memoised risk stats keyed by the raw float64 bytes of a price series."""
+    return _risk_stats(np.frombuffer(key, dtype=np.float64))
+
+
+def calc_risk(
+    prices: Union[List[float], np.ndarray], use_cache: bool = True
+) -> Dict[str, float]:
     """
     Calculate risk metrics for a given price series.
 
     Args:
-        prices: List of price values
+        prices: List or float64 array of price values
+        use_cache: Reuse results for identical price series seen recently
 
     Returns:
         Dictionary containing VaR99, Sharpe ratio, and Alpha
     """
-    if not prices or len(prices) < 2:
+    if prices is None or len(prices) < 2:
         return {"VaR99": 0.0, "Sharpe": 0.0, "Alpha": 0.0}
 
     # Convert to numpy array for calculations
-    prices_array = np.array(prices)
-
-    # Calculate returns
-    returns = np.diff(prices_array) / prices_array[:-1]
+    prices_array = np.ascontiguousarray(prices, dtype=np.float64)
 
-    if len(returns) == 0:
-        return {"VaR99": 0.0, "Sharpe": 0.0, "Alpha": 0.0}
-
-    # Calculate Value at Risk (99th percentile)
-    var99 = np.percentile(returns, 1)  # 1st percentile for 99% VaR
-
-    # Calculate Sharpe ratio (assuming 0% risk-free rate)
-    mean_return = np.mean(returns)
-    std_return = np.std(returns, ddof=1) if len(returns) > 1 else 0.0
-    sharpe = mean_return / std_return if std_return != 0 else 0.0
+    # VaR99 (1st percentile of returns) and Sharpe ratio (assuming 0% risk-free
+    # rate) in one sweep over the series
+    if use_cache:
+        var99, sharpe, mean_return = _cached_risk_stats(prices_array.tobytes())
+    else:
+        var99, sharpe, mean_return = _risk_stats(prices_array)
 
     # Calculate Alpha (excess return over market - simplified as mean return)
     # In a real implementation, this would be calculated against a benchmark
@@ -67,7 +151,7 @@ def calc_portfolio_risk(
     portfolio_returns = np.dot(returns_array.T, weights_array)
 
     # Portfolio VaR
-    portfolio_var99 = np.percentile(portfolio_returns, 1)
+    portfolio_var99 = _lower_quantile(portfolio_returns, 0.01)
 
     # Portfolio volatility
     portfolio_volatility = (
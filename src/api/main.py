@@ -4,11 +4,15 @@ FastAPI application providing REST endpoints for EPV Research Platform
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.orm import configure_mappers
 import logging
 from datetime import datetime
 from typing import Any  # type: ignore
 
 from src.api.routers import analysis, market, risk
+from src.analysis.risk import warm_up_risk_kernel
+from src.data.data_collector import close_http_client
+from src.data.data_gateway import close_data_gateway
 from src.api import sockets
 
 # Authentication modules are temporarily disabled for benchmark
@@ -95,6 +99,15 @@ if create_db_and_tables:
 
     @app.on_event("startup")
     async def on_startup():
+        if not settings.jwt_secret_configured:
+            # Each worker would sign with its own random secret: tokens fail
+            # on the other workers and every restart logs all users out
+            logger.warning(
+                "JWT_SECRET is not set; using a random per-process secret. "
+                "Tokens will not validate across workers or survive restarts."
+            )
+        # Resolve every ORM mapper now instead of on the first query
+        configure_mappers()
         # Database initialization for auth models
         await create_db_and_tables()
 
@@ -105,6 +118,19 @@ else:
         pass
 
 
+@app.on_event("startup")
+async def warm_up_kernels():
+    # Compile numeric kernels before the service takes traffic
+    warm_up_risk_kernel()
+
+
+@app.on_event("shutdown")
+async def close_connections():
+    # Release the shared gateway and the provider connection pool
+    await close_data_gateway()
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     """Root endpoint providing API information"""
@@ -5,12 +5,12 @@ API routes for market data
 from fastapi import APIRouter, HTTPException
 import logging
 
-from src.data.data_gateway import DataGateway
+from src.data.data_gateway import get_data_gateway
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
-data_gateway = DataGateway()
+data_gateway = get_data_gateway()
 
 
 @router.get("/quotes/{symbol}")
@@ -21,4 +21,4 @@ async def get_quote(symbol: str):
     quote = await data_gateway.get_quote(symbol.upper())
     if not quote:
         raise HTTPException(status_code=404, detail=f"Quote not found for {symbol}")
-    return quote
+    return quote._asdict()
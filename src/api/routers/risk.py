@@ -2,12 +2,17 @@
 Risk analysis API endpoints
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import List
+import asyncio
 import logging
 
+import numpy as np
+
 from src.analysis.risk import calc_risk
+from src.api.settings import settings
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -23,7 +28,9 @@ class RiskResponse(BaseModel):
     Alpha: float
 
 
-@router.post("/risk/metrics", response_model=RiskResponse)
+@router.post(
+    "/risk/metrics", response_model=RiskResponse, response_class=ORJSONResponse
+)
 async def calculate_risk_metrics(request: RiskRequest):
     """
     Calculate risk metrics for a given price series.
@@ -51,19 +58,86 @@ async def calculate_risk_metrics(request: RiskRequest):
                     status_code=400, detail="All prices must be positive"
                 )
 
-        logger.info(f"Calculating risk metrics for {len(request.prices)} price points")
+        logger.info("Calculating risk metrics for %d price points", len(request.prices))
+
+        # Calculate risk metrics off the event loop
+        risk_metrics = await asyncio.to_thread(
+            calc_risk, request.prices, use_cache=settings.risk_cache_enabled
+        )
+
+        logger.info("Risk metrics calculated: %s", risk_metrics)
+
+        return RiskResponse(**risk_metrics)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error calculating risk metrics: %s", e)
+        raise HTTPException(
+            status_code=500, detail="Internal server error calculating risk metrics"
+        )
+
 
-        # Calculate risk metrics
-        risk_metrics = calc_risk(request.prices)
+@router.post(
+    "/risk/metrics-binary",
+    response_model=RiskResponse,
+    response_class=ORJSONResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "description": "Prices packed as little-endian float64 values",
+            "content": {
+                "application/octet-stream": {
+                    "schema": {"type": "string", "format": "binary"}
+                }
+            },
+        }
+    },
+)
+async def calculate_risk_metrics_binary(request: Request):
+    """
+    Calculate risk metrics for a price series sent as raw float64 bytes.
+
+    Avoids JSON-decoding large series: the body is viewed directly as a
+    NumPy array without per-element Python float allocation.
+
+    Args:
+        request: Request whose body is packed little-endian float64 prices
 
-        logger.info(f"Risk metrics calculated: {risk_metrics}")
+    Returns:
+        Risk metrics including VaR99, Sharpe ratio, and Alpha
+    """
+    try:
+        body = await request.body()
+        if len(body) % 8 != 0:
+            raise HTTPException(
+                status_code=400,
+                detail="Body must be a whole number of float64 values",
+            )
+
+        prices = np.frombuffer(body, dtype="<f8")
+
+        if prices.size < 2:
+            raise HTTPException(
+                status_code=400,
+                detail="At least 2 price points required for risk calculation",
+            )
+
+        if not (prices > 0).all():
+            raise HTTPException(status_code=400, detail="All prices must be positive")
+
+        logger.info("Calculating risk metrics for %d price points", prices.size)
+
+        risk_metrics = await asyncio.to_thread(
+            calc_risk, prices, use_cache=settings.risk_cache_enabled
+        )
 
         return RiskResponse(**risk_metrics)
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error calculating risk metrics: {e}")
+        logger.error("Error calculating risk metrics: %s", e)
         raise HTTPException(
             status_code=500, detail="Internal server error calculating risk metrics"
         )
@@ -2,6 +2,8 @@
 API settings and configuration using pydantic-settings
 """
 
+import secrets
+
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -12,15 +14,37 @@ class Settings(BaseSettings):
     fred_api_key: str = "demo"
     quandl_api_key: str = "demo"
 
+    # Auth - signing secret for JWT and reset/verification tokens. Falls back to
+    # a random per-process value so no guessable default ever ships; set
+    # JWT_SECRET in any real deployment (see jwt_secret_configured).
+    jwt_secret: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+
     # Application settings
     app_name: str = "EPV Research Platform API"
     log_level: str = "INFO"
 
+    # Database engine - pool sizing is tuned for bursty API load
+    database_url: str = "sqlite+aiosqlite:///./test.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 40
+    db_pool_recycle_seconds: int = 1800
+    db_statement_cache_size: int = 1024
+
+    # Data gateway caching
+    quote_cache_ttl_seconds: float = 60.0
+    quote_cache_max_size: int = 10_000
+
     # Feature flags
     pdf_enabled: bool = Field(False, env="PDF_ENABLED")
+    risk_cache_enabled: bool = True
 
     class Config:
         env_file = ".env"
 
+    @property
+    def jwt_secret_configured(self) -> bool:
+        """Whether JWT_SECRET was set, rather than generated for this process"""
+        return "jwt_secret" in self.model_fields_set
+
 
 settings = Settings()
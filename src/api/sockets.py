@@ -7,66 +7,77 @@ import json
 import logging
 import random
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from src.data.data_gateway import DataGateway
+from src.data.data_gateway import get_data_gateway
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+TICKER_SYMBOLS = ("SPY", "^VIX")
+TICK_INTERVAL_SECONDS = 5.0
+
+
+async def _sleep_until_next_tick(
+    loop: asyncio.AbstractEventLoop, next_tick: float
+) -> float:
+    """
+    Sleep until the next tick deadline and return the following one.
+
+    Deadlines advance on a fixed monotonic schedule, so time spent fetching
+    and sending does not stretch the period. On overrun the schedule resyncs
+    to now instead of firing a burst of catch-up ticks.
+    """
+    next_tick += TICK_INTERVAL_SECONDS
+    delay = next_tick - loop.time()
+    if delay > 0:
+        await asyncio.sleep(delay)
+    else:
+        next_tick = loop.time()
+    return next_tick
+
 
 @router.websocket("/ws/ticker")
 async def ticker_endpoint(websocket: WebSocket):
     await websocket.accept()
-    data_gateway = DataGateway()
+    data_gateway = get_data_gateway()
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
 
     try:
         while True:
             ticker_data = []
 
-            # Get SPY quote
-            spy_quote = await data_gateway.get_quote("SPY")
-            if spy_quote:
-                spy_price = spy_quote.get("price", 0.0)
-                spy_change = spy_quote.get("change", 0.0)
-                ticker_data.append(
-                    {
-                        "symbol": "SPY",
-                        "price": float(spy_price),
-                        "change": float(spy_change),
-                    }
-                )
-
-            # Get VIX quote
-            vix_quote = await data_gateway.get_quote("^VIX")
-            if vix_quote:
-                vix_price = vix_quote.get("price", 0.0)
-                vix_change = vix_quote.get("change", 0.0)
-                ticker_data.append(
-                    {
-                        "symbol": "^VIX",
-                        "price": float(vix_price),
-                        "change": float(vix_change),
-                    }
-                )
+            for symbol in TICKER_SYMBOLS:
+                quote = await data_gateway.get_quote(symbol)
+                if quote:
+                    ticker_data.append(
+                        {
+                            "symbol": quote.symbol,
+                            "price": quote.price,
+                            "change": quote.change,
+                        }
+                    )
 
             # Send ticker data
             for data in ticker_data:
                 await websocket.send_text(json.dumps(data))
 
-            await asyncio.sleep(5)
+            next_tick = await _sleep_until_next_tick(loop, next_tick)
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected")
     except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        logger.error("WebSocket error: %s", e)
         try:
             await websocket.close()
         except Exception as close_exception:
-            logger.error(f"Error closing WebSocket: {close_exception}")
+            logger.error("Error closing WebSocket: %s", close_exception)
 
 
 @router.websocket("/ws/market")
 async def market_data_endpoint(websocket: WebSocket):
     await websocket.accept()
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
     try:
         while True:
             # Simulate real-time market data
@@ -78,6 +89,6 @@ async def market_data_endpoint(websocket: WebSocket):
                 "GOOGL": round(random.uniform(2500, 3000), 2),
             }
             await websocket.send_text(json.dumps(data))
-            await asyncio.sleep(5)
+            next_tick = await _sleep_until_next_tick(loop, next_tick)
     except WebSocketDisconnect:
         logger.info("Market WebSocket client disconnected")
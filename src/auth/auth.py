@@ -8,14 +8,20 @@ from fastapi_users.authentication import (
     JWTStrategy,
 )
 
+from src.api.settings import settings
 
-SECRET = "SECRET"
+SECRET = settings.jwt_secret
 
 cookie_transport = CookieTransport(cookie_name="bonds", cookie_max_age=3600)
 
 
+# The strategy is stateless and the secret is fixed at import, so a single
+# instance is shared across requests instead of being rebuilt per auth call.
+_JWT_STRATEGY = JWTStrategy(secret=SECRET, lifetime_seconds=3600)
+
+
 def get_jwt_strategy() -> JWTStrategy:
-    return JWTStrategy(secret=SECRET, lifetime_seconds=3600)
+    return _JWT_STRATEGY
 
 
 auth_backend = AuthenticationBackend(
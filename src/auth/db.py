@@ -2,24 +2,92 @@
 User database adapter
 """
 
-from typing import AsyncGenerator
+from functools import lru_cache
+from typing import Any, AsyncGenerator, Dict, Tuple
 
 from fastapi import Depends
 from fastapi_users.db import SQLAlchemyUserDatabase
+from sqlalchemy import Index
+from sqlalchemy.engine import URL, Dialect, make_url
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateIndex, CreateTable
 
-from src.auth.models import User, Base
+from src.api.settings import settings
+from src.auth.models import User
+from src.db import Base  # registers the domain tables alongside User
 
-DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+DATABASE_URL = settings.database_url
 
-engine = create_async_engine(DATABASE_URL)
+
+def _engine_options(url: str) -> Dict[str, Any]:
+    """
+    Pool and driver options for the async engine.
+
+    The default pool (5 connections, no overflow) serialises bursty API load;
+    on asyncpg the statement caches also let repeated queries skip re-parsing.
+    """
+    options: Dict[str, Any] = {
+        "echo": False,
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_pre_ping": True,
+        "pool_recycle": settings.db_pool_recycle_seconds,
+    }
+    if make_url(url).drivername == "postgresql+asyncpg":
+        options["connect_args"] = {
+            "statement_cache_size": settings.db_statement_cache_size
+        }
+    return options
+
+
+def _engine_url(url: str) -> URL:
+    """Size SQLAlchemy's asyncpg prepared-statement cache to match the driver's."""
+    parsed = make_url(url)
+    if parsed.drivername != "postgresql+asyncpg":
+        return parsed
+    return parsed.update_query_dict(
+        {"prepared_statement_cache_size": str(settings.db_statement_cache_size)}
+    )
+
+
+engine = create_async_engine(_engine_url(DATABASE_URL), **_engine_options(DATABASE_URL))
 SessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
 
+def _creates_on(index: Index, dialect_name: str) -> bool:
+    """Whether the index belongs on this dialect, per its info={"dialect": ...}"""
+    only_on = index.info.get("dialect")
+    return only_on is None or only_on == dialect_name
+
+
+@lru_cache(maxsize=4)
+def _schema_ddl(table_names: Tuple[str, ...], dialect: Dialect) -> Tuple[str, ...]:
+    """
+    Compile CREATE ... IF NOT EXISTS statements for every registered table.
+
+    Keyed on the registered table names so models imported later still get
+    picked up; otherwise the DDL is compiled once per process. Indexes tagged
+    with another dialect in their info (e.g. the Postgres-only JSONB indexes)
+    are left out.
+    """
+    statements = []
+    for table in Base.metadata.sorted_tables:
+        statements.append(CreateTable(table, if_not_exists=True))
+        statements.extend(
+            CreateIndex(index, if_not_exists=True)
+            for index in sorted(table.indexes, key=lambda index: index.name or "")
+            if _creates_on(index, dialect.name)
+        )
+    return tuple(str(ddl.compile(dialect=dialect)) for ddl in statements)
+
+
 async def create_db_and_tables():
+    # Idempotent DDL in one transaction, instead of create_all's per-table
+    # existence checks against the live database
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        for statement in _schema_ddl(tuple(Base.metadata.tables), engine.dialect):
+            await conn.exec_driver_sql(statement)
 
 
 async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
@@ -7,10 +7,9 @@ from typing import Optional
 from fastapi import Depends, Request
 from fastapi_users import BaseUserManager, IntegerIDMixin
 
+from src.auth.auth import SECRET
 from src.auth.db import User, get_user_db
 
-SECRET = "SECRET"
-
 
 class UserManager(IntegerIDMixin, BaseUserManager[User, int]):
     reset_password_token_secret = SECRET
@@ -90,6 +90,7 @@ class Config(BaseSettings):
     # Logging
     log_level: str = Field(default="INFO")
     log_file: str = Field(default="logs/epv_platform.log")
+    log_format: str = Field(default="text")  # 'text' or 'json' (NDJSON)
 
     class Config:
         env_file = ".env"
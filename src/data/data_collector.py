@@ -3,12 +3,17 @@ Data collection module for the EPV Research Platform
 Integrates multiple data sources for comprehensive financial analysis
 """
 
+import math
 import yfinance as yf
+import numpy as np
+import pandas as pd
+import requests
 import asyncio
+import weakref
 import httpx
-from typing import Dict, List, Optional, Tuple
+import orjson
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 from datetime import datetime, date, timedelta
-import time
 import logging
 from abc import ABC, abstractmethod
 
@@ -20,16 +25,271 @@ from src.models.financial_models import (
     CompanyProfile,
     FinancialRatios,
 )
-from src.utils.cache_manager import CacheManager
+from src.utils.async_runner import run_sync
+from src.utils.cache_manager import CacheManager, TTLCache
 from src.utils.rate_limiter import RateLimiter
 
+try:
+    import h2  # noqa: F401  (httpx's HTTP/2 support)
+
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Statement rows read from yfinance frames, as (model field, row label) pairs
+INCOME_STATEMENT_ROWS = (
+    ("revenue", "Total Revenue"),
+    ("gross_profit", "Gross Profit"),
+    ("operating_income", "Operating Income"),
+    ("ebit", "EBIT"),
+    ("ebitda", "EBITDA"),
+    ("net_income", "Net Income"),
+)
+BALANCE_SHEET_ROWS = (
+    ("total_assets", "Total Assets"),
+    ("current_assets", "Current Assets"),
+    ("cash_and_equivalents", "Cash And Cash Equivalents"),
+    ("inventory", "Inventory"),
+    ("receivables", "Net Receivables"),
+    ("total_liabilities", "Total Liab"),
+    ("current_liabilities", "Current Liabilities"),
+    ("long_term_debt", "Long Term Debt"),
+    ("total_equity", "Total Stockholder Equity"),
+)
+CASH_FLOW_ROWS = (
+    ("operating_cash_flow", "Total Cash From Operating Activities"),
+    ("investing_cash_flow", "Total Cashflows From Investing Activities"),
+    ("financing_cash_flow", "Total Cash From Financing Activities"),
+    ("capital_expenditures", "Capital Expenditures"),
+)
+
+
+def _statement_columns(
+    df: Optional[pd.DataFrame], rows: Tuple[Tuple[str, str], ...], years: int
+) -> List[Tuple[pd.Timestamp, Dict[str, Optional[float]]]]:
+    """
+    Extract the most recent ``years`` columns of a statement frame.
+
+    The frame is reindexed to the wanted rows once and converted to a float
+    array, so each column is a single slice rather than a ``.loc`` lookup per
+    cell. Missing rows and NaN values come back as None.
+    """
+    if df is None or df.empty:
+        return []
+
+    fields = [field for field, _ in rows]
+    df = df[~df.index.duplicated()].iloc[:, :years]
+    values = df.reindex([label for _, label in rows]).to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+
+    return [
+        (
+            col,
+            {
+                field: None if math.isnan(value) else value
+                for field, value in zip(fields, column)
+            },
+        )
+        for col, column in zip(df.columns, values.T.tolist())
+    ]
+
+
+def _parse_statements(
+    symbol: str,
+    income_stmt: Optional[pd.DataFrame],
+    balance_sheet: Optional[pd.DataFrame],
+    cash_flow: Optional[pd.DataFrame],
+    years: int,
+) -> Tuple[List[IncomeStatement], List[BalanceSheet], List[CashFlowStatement]]:
+    """
+    Build statement models from raw yfinance frames.
+
+    A pure top-level function, separate from the network fetch, so it can be
+    unit tested and shipped to a process pool if parsing ever dominates.
+    """
+    income_statements = [
+        IncomeStatement(
+            symbol=symbol,
+            period="annual",
+            fiscal_year=col.year,
+            report_date=col.date(),
+            **fields,
+        )
+        for col, fields in _statement_columns(income_stmt, INCOME_STATEMENT_ROWS, years)
+    ]
+
+    balance_sheets = [
+        BalanceSheet(
+            symbol=symbol,
+            period="annual",
+            fiscal_year=col.year,
+            report_date=col.date(),
+            **fields,
+        )
+        for col, fields in _statement_columns(balance_sheet, BALANCE_SHEET_ROWS, years)
+    ]
+
+    cash_flow_statements = []
+    for col, fields in _statement_columns(cash_flow, CASH_FLOW_ROWS, years):
+        ocf = fields["operating_cash_flow"]
+        capex = fields["capital_expenditures"]
+        cash_flow_statements.append(
+            CashFlowStatement(
+                symbol=symbol,
+                period="annual",
+                fiscal_year=col.year,
+                report_date=col.date(),
+                # capex is usually negative
+                free_cash_flow=(
+                    ocf + capex if ocf is not None and capex is not None else None
+                ),
+                **fields,
+            )
+        )
+
+    return income_statements, balance_sheets, cash_flow_statements
+
+
+def _market_data_from_history(
+    symbol: str, hist: Optional[pd.DataFrame]
+) -> List[MarketData]:
+    """
+    Build MarketData rows from a yfinance history frame.
+
+    Columns are pulled out as whole arrays and zipped, avoiding the per-row
+    Series boxing of ``iterrows``.
+    """
+    if hist is None or hist.empty:
+        return []
+
+    dates = hist.index.date
+    closes = hist["Close"].to_numpy(dtype=np.float64).tolist()
+    volumes = hist["Volume"].to_numpy(dtype=np.float64)
+    volumes = [
+        int(v) if has_volume else None
+        for v, has_volume in zip(volumes.tolist(), ~np.isnan(volumes))
+    ]
+
+    return [
+        MarketData(symbol=symbol, date=d, price=price, volume=volume)
+        for d, price, volume in zip(dates, closes, volumes)
+    ]
+
+
+def _split_download(
+    df: Optional[pd.DataFrame], symbols: List[str]
+) -> Dict[str, pd.DataFrame]:
+    """
+    Split a ``yf.download(group_by="ticker")`` frame into per-symbol histories.
+
+    Rows are aligned across tickers in the combined frame, so dates on which a
+    symbol has no close are dropped from its history.
+    """
+    if df is None or df.empty:
+        return {}
+
+    if not isinstance(df.columns, pd.MultiIndex):
+        # Older yfinance returns flat columns for a single ticker
+        frames = {symbols[0]: df} if len(symbols) == 1 else {}
+    else:
+        available = set(df.columns.get_level_values(0))
+        frames = {symbol: df[symbol] for symbol in symbols if symbol in available}
+
+    return {
+        symbol: frame.dropna(subset=["Close"])
+        for symbol, frame in frames.items()
+        if "Close" in frame
+    }
+
+
+def _market_data_key(symbol: str, start_date: date, end_date: date) -> str:
+    """Per-fetch cache key for a symbol's price history over a date range"""
+    return f"yf_market_{symbol}_{start_date.isoformat()}_{end_date.isoformat()}"
+
+
+# Per-fetch disk cache lifetimes for Yahoo Finance datasets
+PROFILE_EXPIRY_HOURS = 24 * 30
+STATEMENTS_EXPIRY_HOURS = 24 * 90
+MARKET_DATA_EXPIRY_HOURS = 24 * 7
+
+# Ticker.info is shared by profile and quote lookups; keep it briefly so one
+# scrape serves both
+YF_INFO_TTL_SECONDS = 60
+_yf_info_cache = TTLCache(maxsize=1024, ttl=YF_INFO_TTL_SECONDS)
+
+_http_client: Optional[httpx.AsyncClient] = None
+
+# In-flight request caps per provider host, set below the providers' rate
+# ceilings so bursts queue locally instead of triggering 429s
+ALPHA_VANTAGE_HOST = "www.alphavantage.co"
+YAHOO_FINANCE_HOST = "query2.finance.yahoo.com"
+HOST_CONCURRENCY = {ALPHA_VANTAGE_HOST: 2, YAHOO_FINANCE_HOST: 8}
+DEFAULT_HOST_CONCURRENCY = 8
+
+ALPHA_VANTAGE_URL = httpx.URL(f"https://{ALPHA_VANTAGE_HOST}/query")
+
+# Semaphores are bound to an event loop, so keep one set per running loop
+_host_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def host_semaphore(host: str) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent requests to host"""
+    semaphores = _host_semaphores.setdefault(asyncio.get_running_loop(), {})
+    if host not in semaphores:
+        semaphores[host] = asyncio.Semaphore(
+            HOST_CONCURRENCY.get(host, DEFAULT_HOST_CONCURRENCY)
+        )
+    return semaphores[host]
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide AsyncClient, creating it on first use.
+
+    Every DataSource without an injected client shares this pool, so
+    keep-alive connections to a host are reused across providers. With h2
+    installed, concurrent requests to an HTTP/2 host are multiplexed over a
+    single connection.
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=10.0,
+            limits=httpx.Limits(
+                max_connections=64,
+                max_keepalive_connections=32,
+                keepalive_expiry=30.0,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the process-wide AsyncClient if one was created."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 class DataSource(ABC):
     """Abstract base class for data sources"""
 
-    def __init__(self, rate_limiter: Optional[RateLimiter] = None):
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         self.rate_limiter = rate_limiter or RateLimiter()
         self.logger = logging.getLogger(self.__class__.__name__)
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """HTTP client for REST calls: the injected one or the shared pool"""
+        return self._client or get_http_client()
 
     @abstractmethod
     async def get_company_profile(self, symbol: str) -> Optional[CompanyProfile]:
@@ -51,12 +311,25 @@ class DataSource(ABC):
     async def get_quote(self, symbol: str) -> Optional[Dict]:
         pass
 
+    async def aclose(self) -> None:
+        """
+        Release any network resources held by the source.
+
+        The shared and injected HTTP clients are owned elsewhere and are left
+        open; see ``close_http_client``.
+        """
+
 
 class AlphaVantageSource(DataSource):
     """Alpha Vantage data source implementation"""
 
-    def __init__(self, api_key: str, rate_limiter: Optional[RateLimiter] = None):
-        super().__init__(rate_limiter)
+    def __init__(
+        self,
+        api_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        super().__init__(rate_limiter, client)
         self.api_key = api_key
 
     async def get_company_profile(self, symbol: str) -> Optional[CompanyProfile]:
@@ -75,21 +348,25 @@ class AlphaVantageSource(DataSource):
     async def get_quote(self, symbol: str) -> Optional[Dict]:
         """Get the latest quote from Alpha Vantage."""
         try:
-            self.rate_limiter.wait_if_needed()
-            url = f"https://www.alphavantage.co/query?function=GLOBAL_QUOTE&symbol={symbol}&apikey={self.api_key}"
-            async with httpx.AsyncClient() as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                data = response.json()
-                quote = data.get("Global Quote")
-                if quote:
-                    return {
-                        "symbol": quote["01. symbol"],
-                        "price": float(quote["05. price"]),
-                        "timestamp": datetime.now(),
-                        "provider": "AlphaVantage",
-                    }
-                return None
+            await self.rate_limiter.acquire()
+            params = {
+                "function": "GLOBAL_QUOTE",
+                "symbol": symbol,
+                "apikey": self.api_key,
+            }
+            async with host_semaphore(ALPHA_VANTAGE_HOST):
+                response = await self.client.get(ALPHA_VANTAGE_URL, params=params)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            quote = data.get("Global Quote")
+            if quote:
+                return {
+                    "symbol": quote["01. symbol"],
+                    "price": float(quote["05. price"]),
+                    "timestamp": datetime.now(),
+                    "provider": "AlphaVantage",
+                }
+            return None
         except Exception as e:
             self.logger.error(
                 f"Error fetching quote for {symbol} from Alpha Vantage: {e}"
@@ -100,8 +377,13 @@ class AlphaVantageSource(DataSource):
 class FredSource(DataSource):
     """FRED data source implementation"""
 
-    def __init__(self, api_key: str, rate_limiter: Optional[RateLimiter] = None):
-        super().__init__(rate_limiter)
+    def __init__(
+        self,
+        api_key: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        super().__init__(rate_limiter, client)
         self.api_key = api_key
 
     async def get_company_profile(self, symbol: str) -> Optional[CompanyProfile]:
@@ -130,210 +412,232 @@ class YahooFinanceSource(DataSource):
         self,
         rate_limiter: Optional[RateLimiter] = None,
         session: Optional[requests.Session] = None,
+        cache_manager: Optional[CacheManager] = None,
     ):
         super().__init__(rate_limiter)
         self.session = session
+        # Per-fetch cache; each dataset is kept for its own natural lifetime so
+        # a hot sub-fetch is reused even when the combined dataset is not
+        self.cache_manager = cache_manager
 
     async def get_company_profile(self, symbol: str) -> Optional[CompanyProfile]:
-        """Get company profile from Yahoo Finance asynchronously (non-blocking)."""
+        """Get company profile, served from the per-fetch cache when warm."""
+        return await self._cached(
+            f"yf_profile_{symbol}",
+            PROFILE_EXPIRY_HOURS,
+            lambda: self._fetch_company_profile(symbol),
+        )
 
-        def _fetch_profile() -> Optional[CompanyProfile]:
+    async def get_financial_statements(
+        self, symbol: str, years: int = 5
+    ) -> Tuple[List, List, List]:
+        """Get annual financial statements, served from cache when warm."""
+        return await self._cached(
+            f"yf_stmts_{symbol}_{years}",
+            STATEMENTS_EXPIRY_HOURS,
+            lambda: self._fetch_financial_statements(symbol, years),
+        )
+
+    async def get_market_data(
+        self, symbol: str, start_date: date, end_date: date
+    ) -> List[MarketData]:
+        """Get historical OHLC data, served from cache when warm."""
+        return await self._cached(
+            _market_data_key(symbol, start_date, end_date),
+            MARKET_DATA_EXPIRY_HOURS,
+            lambda: self._fetch_market_data(symbol, start_date, end_date),
+        )
+
+    async def get_market_data_batch(
+        self, symbols: List[str], start_date: date, end_date: date
+    ) -> Dict[str, List[MarketData]]:
+        """
+        Get historical OHLC data for many symbols with a single yf.download.
+
+        Symbols already in the per-fetch cache are not re-downloaded, and the
+        freshly downloaded histories are cached under the same keys as
+        ``get_market_data`` so later single-symbol calls are served warm.
+        """
+        results: Dict[str, List[MarketData]] = {}
+        missing = []
+        for symbol in dict.fromkeys(symbols):
+            key = _market_data_key(symbol, start_date, end_date)
+            cached = self.cache_manager.get(key) if self.cache_manager else None
+            if cached is not None:
+                results[symbol] = cached
+            else:
+                missing.append(symbol)
+
+        if not missing:
+            return results
+
+        def _sync_download() -> Dict[str, List[MarketData]]:
             try:
-                ticker = yf.Ticker(symbol, session=self.session)
-                info = ticker.info  # type: ignore[attr-defined]  # blocking network call
-
-                if not info or "shortName" not in info:
-                    return None
-
-                return CompanyProfile(
-                    symbol=symbol,
-                    company_name=info.get("shortName", ""),
-                    sector=info.get("sector"),
-                    industry=info.get("industry"),
-                    country=info.get("country"),
-                    exchange=info.get("exchange"),
-                    currency=info.get("currency"),
-                    description=info.get("longBusinessSummary"),
-                    employees=info.get("fullTimeEmployees"),
-                    market_cap=info.get("marketCap"),
-                    enterprise_value=info.get("enterpriseValue"),
-                    trailing_pe=info.get("trailingPE"),
-                    forward_pe=info.get("forwardPE"),
-                    peg_ratio=info.get("pegRatio"),
-                    dividend_rate=info.get("dividendRate"),
-                    dividend_yield=info.get("dividendYield"),
-                    payout_ratio=info.get("payoutRatio"),
+                df = yf.download(
+                    tickers=missing,
+                    start=start_date,
+                    end=end_date,
+                    group_by="ticker",
+                    threads=True,
+                    progress=False,
+                    session=self.session,
                 )
-            except Exception as exc:  # pragma: no cover – depends on upstream site
-                self.logger.error(f"Error fetching profile for {symbol}: {exc}")
-                return None
+                return {
+                    symbol: _market_data_from_history(symbol, hist)
+                    for symbol, hist in _split_download(df, missing).items()
+                }
+            except Exception as exc:
+                self.logger.error(f"Error downloading hist for {missing}: {exc}")
+                return {}
+
+        await self.rate_limiter.acquire()
+        async with host_semaphore(YAHOO_FINANCE_HOST):
+            downloaded = await asyncio.to_thread(_sync_download)
+
+        for symbol in missing:
+            market_data = downloaded.get(symbol, [])
+            if market_data and self.cache_manager is not None:
+                self.cache_manager.set(
+                    _market_data_key(symbol, start_date, end_date),
+                    market_data,
+                    expiry_hours=MARKET_DATA_EXPIRY_HOURS,
+                )
+            results[symbol] = market_data
+
+        return results
+
+    async def _cached(
+        self, key: str, expiry_hours: int, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Return the cached value for key, else fetch and cache a non-empty result"""
+        if self.cache_manager is None:
+            return await fetch()
+
+        cached = self.cache_manager.get(key)
+        if cached is not None:
+            self.logger.debug(f"Using cached {key}")
+            return cached
+
+        result = await fetch()
+        # Failed fetches come back empty (None, [] or a tuple of empty lists)
+        if result and not (isinstance(result, tuple) and not any(result)):
+            self.cache_manager.set(key, result, expiry_hours=expiry_hours)
+        return result
+
+    async def _get_info(self, symbol: str) -> Optional[Dict]:
+        """
+        Fetch ``Ticker.info`` for a symbol, memoised for a short TTL.
+
+        Profile and quote lookups both read ``info``, which is one of the
+        slowest yfinance calls, so one fetch serves both.
+        """
+        info = _yf_info_cache.get(symbol)
+        if info is not None:
+            return info
+
+        def _fetch_info() -> Optional[Dict]:
+            ticker = yf.Ticker(symbol, session=self.session)
+            return ticker.info  # type: ignore[attr-defined]  # blocking network call
 
         # ensure we respect rate-limits before scheduling thread-work
-        self.rate_limiter.wait_if_needed()
-        return await asyncio.to_thread(_fetch_profile)
+        await self.rate_limiter.acquire()
+        async with host_semaphore(YAHOO_FINANCE_HOST):
+            info = await asyncio.to_thread(_fetch_info)
+        if info:
+            _yf_info_cache[symbol] = info
+        return info
+
+    async def _fetch_company_profile(self, symbol: str) -> Optional[CompanyProfile]:
+        """Get company profile from Yahoo Finance asynchronously (non-blocking)."""
+        try:
+            info = await self._get_info(symbol)
 
-    async def get_financial_statements(
-        self, symbol: str, years: int = 5
+            if not info or "shortName" not in info:
+                return None
+
+            return CompanyProfile(
+                symbol=symbol,
+                company_name=info.get("shortName", ""),
+                sector=info.get("sector"),
+                industry=info.get("industry"),
+                country=info.get("country"),
+                exchange=info.get("exchange"),
+                currency=info.get("currency"),
+                description=info.get("longBusinessSummary"),
+                employees=info.get("fullTimeEmployees"),
+                market_cap=info.get("marketCap"),
+                enterprise_value=info.get("enterpriseValue"),
+                trailing_pe=info.get("trailingPE"),
+                forward_pe=info.get("forwardPE"),
+                peg_ratio=info.get("pegRatio"),
+                dividend_rate=info.get("dividendRate"),
+                dividend_yield=info.get("dividendYield"),
+                payout_ratio=info.get("payoutRatio"),
+            )
+        except Exception as exc:  # pragma: no cover – depends on upstream site
+            self.logger.error(f"Error fetching profile for {symbol}: {exc}")
+            return None
+
+    async def _fetch_financial_statements(
+        self, symbol: str, years: int
     ) -> Tuple[List, List, List]:
         """Get annual financial statements asynchronously using thread pool."""
 
-        def _sync_fetch():  # noqa: C901 – uses heavy yfinance logic
+        def _sync_fetch():
             try:
                 ticker = yf.Ticker(symbol, session=self.session)
-                income_stmt = ticker.financials  # type: ignore[attr-defined]
-                balance_sheet = ticker.balance_sheet  # type: ignore[attr-defined]
-                cash_flow = ticker.cashflow  # type: ignore[attr-defined]
-
-                income_statements, balance_sheets, cash_flow_statements = [], [], []
-
-                if income_stmt is not None and not income_stmt.empty:
-                    for col in income_stmt.columns[:years]:
-                        fiscal_year = col.year
-                        stmt = IncomeStatement(
-                            symbol=symbol,
-                            period="annual",
-                            fiscal_year=fiscal_year,
-                            report_date=col.date(),
-                            revenue=self._safe_get(income_stmt, "Total Revenue", col),
-                            gross_profit=self._safe_get(
-                                income_stmt, "Gross Profit", col
-                            ),
-                            operating_income=self._safe_get(
-                                income_stmt, "Operating Income", col
-                            ),
-                            ebit=self._safe_get(income_stmt, "EBIT", col),
-                            ebitda=self._safe_get(income_stmt, "EBITDA", col),
-                            net_income=self._safe_get(income_stmt, "Net Income", col),
-                        )
-                        income_statements.append(stmt)
-
-                if balance_sheet is not None and not balance_sheet.empty:
-                    for col in balance_sheet.columns[:years]:
-                        fiscal_year = col.year
-                        bs = BalanceSheet(
-                            symbol=symbol,
-                            period="annual",
-                            fiscal_year=fiscal_year,
-                            report_date=col.date(),
-                            total_assets=self._safe_get(
-                                balance_sheet, "Total Assets", col
-                            ),
-                            current_assets=self._safe_get(
-                                balance_sheet, "Current Assets", col
-                            ),
-                            cash_and_equivalents=self._safe_get(
-                                balance_sheet, "Cash And Cash Equivalents", col
-                            ),
-                            inventory=self._safe_get(balance_sheet, "Inventory", col),
-                            receivables=self._safe_get(
-                                balance_sheet, "Net Receivables", col
-                            ),
-                            total_liabilities=self._safe_get(
-                                balance_sheet, "Total Liab", col
-                            ),
-                            current_liabilities=self._safe_get(
-                                balance_sheet, "Current Liabilities", col
-                            ),
-                            long_term_debt=self._safe_get(
-                                balance_sheet, "Long Term Debt", col
-                            ),
-                            total_equity=self._safe_get(
-                                balance_sheet, "Total Stockholder Equity", col
-                            ),
-                        )
-                        balance_sheets.append(bs)
-
-                if cash_flow is not None and not cash_flow.empty:
-                    for col in cash_flow.columns[:years]:
-                        fiscal_year = col.year
-                        cf = CashFlowStatement(
-                            symbol=symbol,
-                            period="annual",
-                            fiscal_year=fiscal_year,
-                            report_date=col.date(),
-                            operating_cash_flow=self._safe_get(
-                                cash_flow, "Total Cash From Operating Activities", col
-                            ),
-                            investing_cash_flow=self._safe_get(
-                                cash_flow,
-                                "Total Cashflows From Investing Activities",
-                                col,
-                            ),
-                            financing_cash_flow=self._safe_get(
-                                cash_flow, "Total Cash From Financing Activities", col
-                            ),
-                            capital_expenditures=self._safe_get(
-                                cash_flow, "Capital Expenditures", col
-                            ),
-                            free_cash_flow=self._calculate_free_cash_flow(
-                                cash_flow, col
-                            ),
-                        )
-                        cash_flow_statements.append(cf)
-
-                return income_statements, balance_sheets, cash_flow_statements
+                return _parse_statements(
+                    symbol,
+                    ticker.financials,  # type: ignore[attr-defined]
+                    ticker.balance_sheet,  # type: ignore[attr-defined]
+                    ticker.cashflow,  # type: ignore[attr-defined]
+                    years,
+                )
             except Exception as exc:
                 self.logger.error(
                     f"Error fetching financial statements for {symbol}: {exc}"
                 )
                 return [], [], []
 
-        self.rate_limiter.wait_if_needed()
-        return await asyncio.to_thread(_sync_fetch)
+        await self.rate_limiter.acquire()
+        async with host_semaphore(YAHOO_FINANCE_HOST):
+            return await asyncio.to_thread(_sync_fetch)
 
-    async def get_market_data(
+    async def _fetch_market_data(
         self, symbol: str, start_date: date, end_date: date
     ) -> List[MarketData]:
         """Get historical OHLC data asynchronously (threaded)."""
 
-        def _sync_hist():
+        def _sync_hist() -> List[MarketData]:
             try:
                 ticker = yf.Ticker(symbol, session=self.session)
-                return ticker.history(start=start_date, end=end_date)  # type: ignore[attr-defined]
+                hist = ticker.history(start=start_date, end=end_date)  # type: ignore[attr-defined]
+                # Convert on the worker thread too, keeping the loop free
+                return _market_data_from_history(symbol, hist)
             except Exception as exc:
                 self.logger.error(f"Error fetching hist for {symbol}: {exc}")
-                return None
+                return []
 
-        self.rate_limiter.wait_if_needed()
-        hist = await asyncio.to_thread(_sync_hist)
-
-        market_data: List[MarketData] = []
-        if hist is None or hist.empty:
-            return market_data
-
-        for idx, row in hist.iterrows():
-            market_data.append(
-                MarketData(
-                    symbol=symbol,
-                    date=idx.date(),
-                    price=row["Close"],
-                    volume=int(row["Volume"]) if pd.notna(row["Volume"]) else None,
-                )
-            )
-        return market_data
+        await self.rate_limiter.acquire()
+        async with host_semaphore(YAHOO_FINANCE_HOST):
+            return await asyncio.to_thread(_sync_hist)
 
     async def get_quote(self, symbol: str) -> Optional[Dict]:
         """Fast, non-blocking latest quote via thread off-loading."""
-
-        def _sync_quote():
-            try:
-                ticker = yf.Ticker(symbol, session=self.session)
-                info = ticker.info  # type: ignore[attr-defined]
-                if info and info.get("regularMarketPrice"):
-                    return {
-                        "symbol": symbol,
-                        "price": info["regularMarketPrice"],
-                        "timestamp": datetime.now(),
-                        "provider": "YahooFinance",
-                    }
-            except Exception as exc:
-                self.logger.error(
-                    f"Error fetching quote for {symbol} from Yahoo Finance: {exc}"
-                )
-            return None
-
-        self.rate_limiter.wait_if_needed()
-        return await asyncio.to_thread(_sync_quote)
+        try:
+            info = await self._get_info(symbol)
+            if info and info.get("regularMarketPrice"):
+                return {
+                    "symbol": symbol,
+                    "price": info["regularMarketPrice"],
+                    "timestamp": datetime.now(),
+                    "provider": "YahooFinance",
+                }
+        except Exception as exc:
+            self.logger.error(
+                f"Error fetching quote for {symbol} from Yahoo Finance: {exc}"
+            )
+        return None
 
     def _safe_get(self, df: pd.DataFrame, key: str, column) -> Optional[float]:
         """Safely get value from DataFrame"""
@@ -343,25 +647,12 @@ class YahooFinanceSource(DataSource):
                 return float(value) if pd.notna(value) else None
             return None
         except Exception as exc:
-            self.logger.error(f"Error fetching hist for {symbol}: {exc}")
+            self.logger.error(f"Error reading {key} for {column}: {exc}")
             return None
 
-    def _calculate_free_cash_flow(
-        self, cash_flow: pd.DataFrame, column
-    ) -> Optional[float]:
-        """Calculate free cash flow"""
-        try:
-            ocf = self._safe_get(
-                cash_flow, "Total Cash From Operating Activities", column
-            )
-            capex = self._safe_get(cash_flow, "Capital Expenditures", column)
 
-            if ocf is not None and capex is not None:
-                return ocf + capex  # capex is usually negative
-            return None
-        except Exception as exc:
-            self.logger.error(f"Error fetching hist for {symbol}: {exc}")
-            return None
+# Price history window collected per company
+MARKET_DATA_LOOKBACK_DAYS = 730
 
 
 class DataCollector:
@@ -372,7 +663,9 @@ class DataCollector:
         self.rate_limiter = RateLimiter(requests_per_minute=30)
 
         # Initialize data sources
-        self.yahoo_finance = YahooFinanceSource(self.rate_limiter)
+        self.yahoo_finance = YahooFinanceSource(
+            self.rate_limiter, cache_manager=self.cache_manager
+        )
 
         self.logger = logging.getLogger(__name__)
 
@@ -413,7 +706,7 @@ class DataCollector:
 
         # Market data (last 2y) – can run in parallel as well
         end_date = date.today()
-        start_date = end_date - timedelta(days=730)
+        start_date = end_date - timedelta(days=MARKET_DATA_LOOKBACK_DAYS)
         market_task = asyncio.create_task(
             self.yahoo_finance.get_market_data(symbol, start_date, end_date)
         )
@@ -444,7 +737,7 @@ class DataCollector:
     # ---------------------------------------------------------------------
     def collect_company_data(self, symbol: str, years: int = 10) -> Dict:  # noqa: D401
         """Synchronous wrapper for code paths still expecting blocking call."""
-        return asyncio.run(self.collect_company_data_async(symbol, years))
+        return run_sync(self.collect_company_data_async(symbol, years))
 
     # ---------------------------------------------------------------------
     # Convenience aliases
@@ -468,49 +761,40 @@ class DataCollector:
 
         try:
             income_stmts = data["income_statements"]
-            balance_sheets = data["balance_sheets"]
+            # First balance sheet per fiscal year (reversed so earlier entries win)
+            bs_by_year = {bs.fiscal_year: bs for bs in reversed(data["balance_sheets"])}
+            symbol = data["symbol"]
+            today = date.today()
 
             # Match statements by fiscal year
             for income_stmt in income_stmts:
-                matching_bs = next(
-                    (
-                        bs
-                        for bs in balance_sheets
-                        if bs.fiscal_year == income_stmt.fiscal_year
-                    ),
-                    None,
-                )
+                matching_bs = bs_by_year.get(income_stmt.fiscal_year)
+                if matching_bs is None:
+                    continue
+
+                net_income = income_stmt.net_income
+                revenue = income_stmt.revenue
+                total_equity = matching_bs.total_equity
 
-                if matching_bs and income_stmt.net_income and matching_bs.total_equity:
-                    ratio = FinancialRatios(
-                        symbol=data["symbol"], calculation_date=date.today()
-                    )
+                if net_income and total_equity:
+                    ratio = FinancialRatios(symbol=symbol, calculation_date=today)
 
                     # Calculate profitability ratios
-                    if income_stmt.net_income and matching_bs.total_equity:
-                        ratio.roe = (
-                            income_stmt.net_income / matching_bs.total_equity
-                        ) * 100
+                    ratio.roe = (net_income / total_equity) * 100
 
-                    if income_stmt.net_income and matching_bs.total_assets:
-                        ratio.roa = (
-                            income_stmt.net_income / matching_bs.total_assets
-                        ) * 100
+                    if matching_bs.total_assets:
+                        ratio.roa = (net_income / matching_bs.total_assets) * 100
 
-                    if income_stmt.revenue and income_stmt.gross_profit:
-                        ratio.gross_margin = (
-                            income_stmt.gross_profit / income_stmt.revenue
-                        ) * 100
+                    if revenue and income_stmt.gross_profit:
+                        ratio.gross_margin = (income_stmt.gross_profit / revenue) * 100
 
-                    if income_stmt.revenue and income_stmt.operating_income:
+                    if revenue and income_stmt.operating_income:
                         ratio.operating_margin = (
-                            income_stmt.operating_income / income_stmt.revenue
+                            income_stmt.operating_income / revenue
                         ) * 100
 
-                    if income_stmt.revenue and income_stmt.net_income:
-                        ratio.net_margin = (
-                            income_stmt.net_income / income_stmt.revenue
-                        ) * 100
+                    if revenue:
+                        ratio.net_margin = (net_income / revenue) * 100
 
                     # Calculate liquidity ratios
                     if matching_bs.current_assets and matching_bs.current_liabilities:
@@ -519,10 +803,8 @@ class DataCollector:
                         )
 
                     # Calculate leverage ratios
-                    if matching_bs.long_term_debt and matching_bs.total_equity:
-                        ratio.debt_to_equity = (
-                            matching_bs.long_term_debt / matching_bs.total_equity
-                        )
+                    if matching_bs.long_term_debt and total_equity:
+                        ratio.debt_to_equity = matching_bs.long_term_debt / total_equity
 
                     ratios.append(ratio)
 
@@ -531,21 +813,51 @@ class DataCollector:
 
         return ratios
 
-    def get_peer_comparison_data(self, symbol: str, peer_symbols: List[str]) -> Dict:
-        """Get comparative data for peer analysis"""
-        comparison_data = {"target": symbol, "peers": {}}
+    async def get_peer_comparison_data_async(
+        self, symbol: str, peer_symbols: List[str], max_concurrency: int = 8
+    ) -> Dict:
+        """Get comparative data for peer analysis, collecting peers concurrently"""
+        comparison_data: Dict = {"target": symbol, "peers": {}}
+
+        # Bound in-flight collections; the shared RateLimiter still enforces
+        # the per-minute provider cap
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Download every symbol's price history in one request up front; the
+        # per-symbol collections below then find it in the per-fetch cache
+        end_date = date.today()
+        start_date = end_date - timedelta(days=MARKET_DATA_LOOKBACK_DAYS)
+        try:
+            await self.yahoo_finance.get_market_data_batch(
+                [symbol, *peer_symbols], start_date, end_date
+            )
+        except Exception as e:
+            self.logger.warning(f"Batch market data prefetch failed: {e}")
+
+        async def fetch(s: str) -> Dict:
+            async with semaphore:
+                return await self.collect_company_data_async(s, years=5)
 
-        # Get target company data
-        target_data = self.collect_company_data(symbol, years=5)
+        target_data, *peer_results = await asyncio.gather(
+            fetch(symbol),
+            *(fetch(peer_symbol) for peer_symbol in peer_symbols),
+            return_exceptions=True,
+        )
+
+        if isinstance(target_data, BaseException):
+            raise target_data
         comparison_data["target_data"] = target_data
 
-        # Get peer data
-        for peer_symbol in peer_symbols:
-            try:
-                peer_data = self.collect_company_data(peer_symbol, years=5)
+        for peer_symbol, peer_data in zip(peer_symbols, peer_results):
+            if isinstance(peer_data, BaseException):
+                self.logger.error(
+                    f"Error collecting peer data for {peer_symbol}: {peer_data}"
+                )
+            else:
                 comparison_data["peers"][peer_symbol] = peer_data
-                time.sleep(1)  # Rate limiting
-            except Exception as e:
-                self.logger.error(f"Error collecting peer data for {peer_symbol}: {e}")
 
         return comparison_data
+
+    def get_peer_comparison_data(self, symbol: str, peer_symbols: List[str]) -> Dict:
+        """Synchronous wrapper for `get_peer_comparison_data_async`."""
+        return run_sync(self.get_peer_comparison_data_async(symbol, peer_symbols))
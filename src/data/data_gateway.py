@@ -2,8 +2,18 @@
 Data gateway for fetching financial data from multiple providers
 """
 
+import asyncio
 import logging
-from typing import Optional, List, Dict, Sequence
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    Optional,
+    List,
+    Dict,
+    NamedTuple,
+    Sequence,
+)
 from datetime import datetime, timedelta
 
 from src.data.data_collector import (
@@ -13,9 +23,35 @@ from src.data.data_collector import (
     FredSource,
 )
 from src.models.financial_models import MarketData
-from src.utils.cache_manager import CacheManager
+from src.utils.cache_manager import CacheManager, TTLCache
 from src.api.settings import settings
 
+# Disk cache lifetimes: statements only change quarterly, and a week-old
+# price history is acceptable for valuation inputs
+PRICES_EXPIRY_HOURS = 24 * 7
+FUNDAMENTALS_EXPIRY_HOURS = 24 * 90
+
+
+class Quote(NamedTuple):
+    """Latest quote for a symbol, normalised across providers."""
+
+    symbol: str
+    price: float
+    change: float = 0.0
+    timestamp: Any = None
+    provider: Optional[str] = None
+
+    @classmethod
+    def from_provider(cls, symbol: str, raw: Dict) -> "Quote":
+        """Build a quote from a provider's raw quote dict."""
+        return cls(
+            symbol=raw.get("symbol", symbol),
+            price=float(raw["price"]),
+            change=float(raw.get("change") or 0.0),
+            timestamp=raw.get("timestamp"),
+            provider=raw.get("provider"),
+        )
+
 
 class DataGateway:
     """
@@ -34,7 +70,69 @@ class DataGateway:
             AlphaVantageSource(api_key=settings.alpha_vantage_api_key),
             FredSource(api_key=settings.fred_api_key),
         ]
-        self.quote_cache = {}  # In-memory cache for quotes
+        # In-memory quote cache; entries expire on the quote refresh cadence
+        self.quote_cache = TTLCache(
+            maxsize=settings.quote_cache_max_size,
+            ttl=settings.quote_cache_ttl_seconds,
+        )
+
+    async def aclose(self) -> None:
+        """Close the network resources held by every provider."""
+        for provider in self.providers:
+            try:
+                await provider.aclose()
+            except Exception as e:
+                self.logger.warning(
+                    f"Failed to close {provider.__class__.__name__}: {e}"
+                )
+
+    async def _first_available(
+        self,
+        what: str,
+        symbol: str,
+        fetch: Callable[[DataSource], Coroutine[Any, Any, Any]],
+    ) -> Optional[Any]:
+        """
+        Query every provider concurrently and return the first non-empty result.
+
+        Latency is that of the fastest successful provider rather than the sum
+        of every slower or failing one ahead of it. Providers that complete
+        together are preferred in priority order, and the rest are cancelled
+        once a result is found. Cancelling doesn't refund a provider's rate
+        limit, so every call spends an Alpha Vantage slot even when Yahoo
+        answers first.
+        """
+        tasks: Dict[asyncio.Task, DataSource] = {
+            asyncio.create_task(fetch(provider)): provider
+            for provider in self.providers
+        }
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in [t for t in tasks if t in done]:
+                    provider_name = tasks[task].__class__.__name__
+                    if task.exception() is not None:
+                        self.logger.warning(
+                            f"Failed to fetch {what} for {symbol} from {provider_name}: {task.exception()}"
+                        )
+                        continue
+                    result = task.result()
+                    if result:
+                        self.logger.info(
+                            f"Fetched {what} for {symbol} from {provider_name}"
+                        )
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        self.logger.error(f"Failed to fetch {what} for {symbol} from all providers.")
+        return None
 
     async def get_prices(self, symbol: str) -> Optional[Sequence[MarketData]]:
         """Get historical prices for a symbol."""
@@ -44,49 +142,32 @@ class DataGateway:
             self.logger.info(f"Using cached price data for {symbol}")
             return cached_data
 
-        for provider in self.providers:
-            try:
-                end_date = datetime.now().date()
-                start_date = end_date - timedelta(days=365 * 5)  # 5 years of data
-                prices = await provider.get_market_data(symbol, start_date, end_date)
-                if prices:
-                    self.logger.info(
-                        f"Fetched price data for {symbol} from {provider.__class__.__name__}"
-                    )
-                    self.cache_manager.set(cache_key, prices)
-                    return prices
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to fetch price data for {symbol} from {provider.__class__.__name__}: {e}"
-                )
-
-        self.logger.error(
-            f"Failed to fetch price data for {symbol} from all providers."
+        end_date = datetime.now().date()
+        start_date = end_date - timedelta(days=365 * 5)  # 5 years of data
+        prices = await self._first_available(
+            "price data",
+            symbol,
+            lambda provider: provider.get_market_data(symbol, start_date, end_date),
         )
-        return None
+        if prices:
+            self.cache_manager.set(cache_key, prices, expiry_hours=PRICES_EXPIRY_HOURS)
+        return prices
 
-    async def get_quote(self, symbol: str) -> Optional[Dict]:
+    async def get_quote(self, symbol: str) -> Optional[Quote]:
         """Get the latest quote for a symbol."""
-        if symbol in self.quote_cache:
+        cached_quote = self.quote_cache.get(symbol)
+        if cached_quote is not None:
             self.logger.info(f"Using in-memory quote for {symbol}")
-            return self.quote_cache[symbol]
+            return cached_quote
 
-        for provider in self.providers:
-            try:
-                quote = await provider.get_quote(symbol)
-                if quote:
-                    self.logger.info(
-                        f"Fetched quote for {symbol} from {provider.__class__.__name__}"
-                    )
-                    self.quote_cache[symbol] = quote
-                    return quote
-            except Exception as e:
-                self.logger.warning(
-                    f"Failed to fetch quote for {symbol} from {provider.__class__.__name__}: {e}"
-                )
+        async def fetch(provider: DataSource) -> Optional[Quote]:
+            raw_quote = await provider.get_quote(symbol)
+            return Quote.from_provider(symbol, raw_quote) if raw_quote else None
 
-        self.logger.error(f"Failed to fetch quote for {symbol} from all providers.")
-        return None
+        quote = await self._first_available("quote", symbol, fetch)
+        if quote is not None:
+            self.quote_cache[symbol] = quote
+        return quote
 
     async def get_fundamentals(self, symbol: str) -> Optional[Dict]:
         """Get fundamental data for a symbol."""
@@ -112,7 +193,9 @@ class DataGateway:
                     self.logger.info(
                         f"Fetched fundamental data for {symbol} from {provider.__class__.__name__}"
                     )
-                    self.cache_manager.set(cache_key, fundamentals)
+                    self.cache_manager.set(
+                        cache_key, fundamentals, expiry_hours=FUNDAMENTALS_EXPIRY_HOURS
+                    )
                     return fundamentals
             except Exception as e:
                 self.logger.warning(
@@ -123,3 +206,27 @@ class DataGateway:
             f"Failed to fetch fundamental data for {symbol} from all providers."
         )
         return None
+
+
+_default_gateway: Optional[DataGateway] = None
+
+
+def get_data_gateway() -> DataGateway:
+    """
+    Return the process-wide DataGateway, creating it on first use.
+
+    Sharing one instance lets every API route and WebSocket connection reuse
+    the same providers, rate limiter and in-memory quote cache.
+    """
+    global _default_gateway
+    if _default_gateway is None:
+        _default_gateway = DataGateway()
+    return _default_gateway
+
+
+async def close_data_gateway() -> None:
+    """Close the process-wide DataGateway if one was created."""
+    global _default_gateway
+    if _default_gateway is not None:
+        await _default_gateway.aclose()
+        _default_gateway = None
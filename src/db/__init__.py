@@ -0,0 +1,25 @@
+"""
+Database models for the EPV Research Platform
+
+Every table - auth and domain - hangs off the single declarative ``Base`` from
+``src.auth.models``; importing this package registers all of them on
+``Base.metadata``.
+"""
+
+from src.auth.models import Base  # type: ignore
+from src.db.models import (
+    CompanyProfile,
+    FinancialMetric,
+    FinancialStatement,
+    MarketData,
+    Report,
+)
+
+__all__ = [
+    "Base",
+    "CompanyProfile",
+    "FinancialMetric",
+    "FinancialStatement",
+    "MarketData",
+    "Report",
+]
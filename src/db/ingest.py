@@ -0,0 +1,51 @@
+"""
+Bulk ingestion helpers for the domain tables
+"""
+
+from typing import Iterable
+
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.db.models import MarketData
+from src.models.financial_models import MarketData as MarketDataPoint
+
+# Rows per INSERT; keeps bound parameters well under the Postgres and SQLite caps
+MARKET_DATA_CHUNK_SIZE = 5000
+
+_DIALECT_INSERTS = {"postgresql": pg_insert, "sqlite": sqlite_insert}
+
+
+async def bulk_upsert_market_data(
+    session: AsyncSession, company_id: int, rows: Iterable[MarketDataPoint]
+) -> int:
+    """
+    Insert a company's price history, skipping dates already stored.
+
+    Rows go in as multi-row INSERT ... ON CONFLICT DO NOTHING batches against
+    the (company_id, date) unique index, in the session's transaction. Returns
+    the number of rows actually inserted.
+    """
+    insert = _DIALECT_INSERTS[session.bind.dialect.name]
+    statement = (
+        insert(MarketData)
+        .on_conflict_do_nothing(index_elements=["company_id", "date"])
+        .returning(MarketData.id)
+    )
+
+    values = [
+        {
+            "company_id": company_id,
+            "date": row.date,
+            "price": row.price,
+            "volume": row.volume,
+        }
+        for row in rows
+    ]
+    inserted = 0
+    for start in range(0, len(values), MARKET_DATA_CHUNK_SIZE):
+        chunk = values[start : start + MARKET_DATA_CHUNK_SIZE]
+        result = await session.execute(statement, chunk)
+        inserted += len(result.all())
+    return inserted
@@ -13,7 +13,13 @@ from sqlalchemy import (
     JSON,
     ForeignKey,
     Index,
+    delete,
+    event,
+    func,
+    insert,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 
 # Re-use declarative Base that already powers the auth.User table so that all
@@ -22,6 +28,7 @@ from src.auth.models import Base  # type: ignore
 
 __all__ = [
     "CompanyProfile",
+    "FinancialMetric",
     "FinancialStatement",
     "MarketData",
     "Report",
@@ -52,14 +59,23 @@ class CompanyProfile(Base):
     market_cap: Optional[int] = Column(BigInteger)
 
     created_at: datetime = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    # Statements and prices are always consumed together, so load them with
+    # one IN query per collection rather than one SELECT per company. This
+    # also keeps them usable from AsyncSession, where lazy loads cannot run.
     financial_statements = relationship(
-        "FinancialStatement", back_populates="company", cascade="all, delete-orphan"
+        "FinancialStatement",
+        back_populates="company",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
     market_data = relationship(
-        "MarketData", back_populates="company", cascade="all, delete-orphan"
+        "MarketData",
+        back_populates="company",
+        cascade="all, delete-orphan",
+        lazy="selectin",
     )
     reports = relationship(
         "Report", back_populates="company", cascade="all, delete-orphan"
@@ -87,9 +103,9 @@ class FinancialStatement(Base):
     fiscal_year: int = Column(Integer, nullable=False)
     fiscal_quarter: Optional[int] = Column(Integer)
 
-    data: Any = Column(JSON, nullable=False)
+    data: Any = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
     created_at: datetime = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     company = relationship("CompanyProfile", back_populates="financial_statements")
@@ -105,9 +121,88 @@ class FinancialStatement(Base):
             "fiscal_quarter",
             unique=True,
         ),
+        # Postgres only: jsonb_path_ops GIN serves `data @> '{...}'` containment
+        # filters at roughly half the size of a default GIN index. info tags
+        # these for create_db_and_tables' own DDL; ddl_if covers create_all ...
+        Index(
+            "ix_fin_stmt_data_path",
+            "data",
+            postgresql_using="gin",
+            postgresql_ops={"data": "jsonb_path_ops"},
+            info={"dialect": "postgresql"},
+        ).ddl_if(dialect="postgresql"),
+        # ... while ->> comparisons and ordering need BTREE expression indexes
+        Index(
+            "ix_fin_stmt_net_income",
+            text("((data->>'net_income')::numeric)"),
+            info={"dialect": "postgresql"},
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_fin_stmt_revenue",
+            text("((data->>'revenue')::numeric)"),
+            info={"dialect": "postgresql"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+
+class FinancialMetric(Base):
+    """One numeric statement line item per row, flattened from FinancialStatement.
+
+    The JSON statement stays the canonical raw record; this table mirrors its
+    numeric fields so time series of a metric can be read by index instead of
+    deserialising one JSON document per year.
+    """
+
+    __tablename__ = "financial_metric"
+
+    id: int = Column(Integer, primary_key=True)
+    statement_id: int = Column(
+        Integer,
+        ForeignKey("financial_statement.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    company_id: int = Column(
+        Integer, ForeignKey("company_profile.id", ondelete="CASCADE"), nullable=False
+    )
+
+    fiscal_year: int = Column(Integer, nullable=False)
+    fiscal_quarter: Optional[int] = Column(Integer)
+    metric_name: str = Column(String(64), nullable=False)
+    value: float = Column(Float, nullable=False)
+
+    __table_args__ = (
+        Index("ix_fm_lookup", "company_id", "metric_name", "fiscal_year"),
+        Index("ix_fm_statement", "statement_id"),
     )
 
 
+def _metric_rows(statement: FinancialStatement) -> list:
+    """Numeric fields of a statement's payload as financial_metric rows."""
+    return [
+        {
+            "statement_id": statement.id,
+            "company_id": statement.company_id,
+            "fiscal_year": statement.fiscal_year,
+            "fiscal_quarter": statement.fiscal_quarter,
+            "metric_name": name,
+            "value": float(value),
+        }
+        for name, value in (statement.data or {}).items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+
+
+@event.listens_for(FinancialStatement, "after_insert")
+@event.listens_for(FinancialStatement, "after_update")
+def _sync_financial_metrics(mapper, connection, statement) -> None:
+    """Keep financial_metric in step with each flushed statement."""
+    metrics = FinancialMetric.__table__
+    connection.execute(delete(metrics).where(metrics.c.statement_id == statement.id))
+    rows = _metric_rows(statement)
+    if rows:
+        connection.execute(insert(metrics), rows)
+
+
 class MarketData(Base):
     """Daily market prices and volumes."""
 
@@ -123,13 +218,21 @@ class MarketData(Base):
     volume: Optional[int] = Column(BigInteger)
 
     created_at: datetime = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     company = relationship("CompanyProfile", back_populates="market_data")
 
     __table_args__ = (
-        Index("ix_market_data_company_date", "company_id", "date", unique=True),
+        # Carrying price in the index lets "latest price" lookups (a backward
+        # scan of the latest date per company) run as index-only scans
+        Index(
+            "ix_market_data_company_date",
+            "company_id",
+            "date",
+            unique=True,
+            postgresql_include=["price"],
+        ),
     )
 
 
@@ -153,7 +256,7 @@ class Report(Base):
     file_path: Optional[str] = Column(String(512))
 
     created_at: datetime = Column(
-        DateTime(timezone=True), default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
     company = relationship("CompanyProfile", back_populates="reports")
@@ -4,20 +4,79 @@ Entry point for the earnings power value research and analysis system
 """
 
 import sys
+import asyncio
 import logging
+from datetime import date
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, TextIO
 import argparse
+import csv
 
-# Add src to path for imports
-sys.path.append(str(Path(__file__).parent))
+import orjson
 
-from src.data.data_collector import DataCollector
-from src.analysis.epv_calculator import EPVCalculator
-from src.analysis.research_generator import ResearchGenerator
-from src.utils.cache_manager import CacheManager
+# The data and analysis stack (yfinance, pandas, ...) is imported by
+# EPVResearchPlatform itself, so commands that don't need it start quickly
+from src.utils.async_runner import run_sync
+from src.utils.cache_manager import CacheManager, TTLCache
 from src.config.config import config, setup_directories
 
+# Where analysis and batch exports are written, relative to the working dir
+EXPORT_DIR = "exports"
+
+# Symbols analysed at once in batch mode. The work is mostly provider I/O,
+# which the shared RateLimiter still paces
+BATCH_MAX_CONCURRENCY = 8
+
+# In-process quick EPV memo: bounded, and entries only live for the day
+QUICK_CACHE_MAX_SIZE = 512
+QUICK_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Batch summary CSV columns, mapped to their quick_epv result keys
+BATCH_EXPORT_COLUMNS = {
+    "Company": "company_name",
+    "EPV_Per_Share": "epv_per_share",
+    "Current_Price": "current_price",
+    "Margin_of_Safety": "margin_of_safety",
+    "Quality_Score": "quality_score",
+    "Cost_of_Capital": "cost_of_capital",
+}
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop for event loops created in this process when it is installed
+
+    The sync entry points run the collectors' concurrent provider fetches
+    on run_sync's background loop (src/utils/async_runner.py). That loop is
+    created from the event loop policy on the first run_sync call, so this
+    must be called before then; main() does so before building the platform.
+    The API server needs no call, as uvicorn picks uvloop itself.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+class JsonLogFormatter(logging.Formatter):
+    """Formats each record as a single-line JSON object, for log aggregators"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": record.created,
+            "lvl": record.levelname,
+            "name": record.name,
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
 
 def setup_logging():
     """Setup logging configuration"""
@@ -25,28 +84,112 @@ def setup_logging():
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
 
-    # Configure logging
+    handlers = [
+        logging.FileHandler(config.log_file),
+        logging.StreamHandler(sys.stdout),
+    ]
+    if config.log_format.lower() == "json":
+        formatter = JsonLogFormatter()
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+    # Configure logging; handlers without a formatter get the text format
     logging.basicConfig(
         level=getattr(logging, config.log_level.upper()),
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[
-            logging.FileHandler(config.log_file),
-            logging.StreamHandler(sys.stdout),
-        ],
+        handlers=handlers,
     )
 
 
+def summarize_batch(successful_results: List[dict]) -> dict:
+    """
+    Summary statistics over successful quick-EPV results, in a single pass
+
+    Missing or zero EPV and quality values are left out of their averages;
+    margins of safety are only skipped when missing.
+    """
+    epv_total = quality_total = margin_total = 0.0
+    epv_count = quality_count = margin_count = 0
+    undervalued_count = high_quality_count = 0
+
+    for result in successful_results:
+        epv = result["epv_per_share"]
+        if epv:
+            epv_total += epv
+            epv_count += 1
+        quality = result["quality_score"]
+        if quality:
+            quality_total += quality
+            quality_count += 1
+            high_quality_count += quality > 0.7
+        margin = result["margin_of_safety"]
+        if margin is not None:
+            margin_total += margin
+            margin_count += 1
+            undervalued_count += margin > 0
+
+    return {
+        "avg_epv": epv_total / epv_count if epv_count else 0,
+        "avg_quality": quality_total / quality_count if quality_count else 0,
+        "avg_margin_of_safety": margin_total / margin_count if margin_count else 0,
+        "undervalued_count": undervalued_count,
+        "high_quality_count": high_quality_count,
+    }
+
+
+class BatchExport:
+    """Batch summary CSV, written one row at a time as symbols complete"""
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self.rows = 0
+        self._file: Optional[TextIO] = None
+        self._writer: Optional[Any] = None  # csv writer over _file
+
+    def write(self, symbol: str, data: dict) -> None:
+        """Append a successful result, creating the file on the first row"""
+        if self._file is None or self._writer is None:
+            # Reopened after close(): append rather than truncate earlier rows
+            self._file = open(self.filename, "a" if self.rows else "w", newline="")
+            self._writer = csv.writer(self._file)
+            if not self.rows:
+                self._writer.writerow(["Symbol", *BATCH_EXPORT_COLUMNS])
+        self._writer.writerow(
+            [symbol, *(data[key] for key in BATCH_EXPORT_COLUMNS.values())]
+        )
+        # Keep the file a valid CSV of every completed symbol
+        self._file.flush()
+        self.rows += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+        self._file = None
+        self._writer = None
+
+
 class EPVResearchPlatform:
     """
     Main application class for the EPV Research Platform
     """
 
     def __init__(self):
+        from src.data.data_collector import DataCollector
+        from src.analysis.epv_calculator import EPVCalculator
+        from src.analysis.research_generator import ResearchGenerator
+
         self.cache_manager = CacheManager()
         self.data_collector = DataCollector(self.cache_manager)
         self.epv_calculator = EPVCalculator()
         self.research_generator = ResearchGenerator(self.cache_manager)
         self.logger = logging.getLogger(__name__)
+        # Quick EPV results for this process, keyed by (symbol, day)
+        self._quick_cache = TTLCache(
+            maxsize=QUICK_CACHE_MAX_SIZE, ttl=QUICK_CACHE_TTL_SECONDS
+        )
+        # Exports are written at the end of an analysis; make sure they have
+        # somewhere to go when the platform is used outside the CLI
+        Path(EXPORT_DIR).mkdir(exist_ok=True)
 
         self.logger.info("EPV Research Platform initialized")
 
@@ -71,7 +214,7 @@ class EPVResearchPlatform:
         """
 
         try:
-            self.logger.info(f"Starting analysis for {symbol}")
+            self.logger.info("Starting analysis for %s", symbol)
 
             # Generate comprehensive research report
             report = self.research_generator.generate_research_report(
@@ -116,17 +259,19 @@ class EPVResearchPlatform:
                 )
                 export_filename = f"{symbol}_analysis_{report.report_date.strftime('%Y%m%d')}.{export_format}"
 
-                with open(f"exports/{export_filename}", "w") as f:
+                with open(f"{EXPORT_DIR}/{export_filename}", "wb") as f:
                     f.write(export_data)
 
                 results["export_file"] = export_filename
-                self.logger.info(f"Analysis exported to {export_filename}")
+                self.logger.info("Analysis exported to %s", export_filename)
 
-            self.logger.info(f"Analysis complete for {symbol}: {report.recommendation}")
+            self.logger.info(
+                "Analysis complete for %s: %s", symbol, report.recommendation
+            )
             return results
 
         except Exception as e:
-            self.logger.error(f"Error analyzing {symbol}: {e}")
+            self.logger.error("Error analyzing %s: %s", symbol, e)
             raise
 
     def quick_epv(self, symbol: str) -> dict:
@@ -139,56 +284,84 @@ class EPVResearchPlatform:
         Returns:
             Dictionary with EPV results
         """
+        return run_sync(self.quick_epv_async(symbol))
 
-        try:
-            self.logger.info(f"Quick EPV calculation for {symbol}")
-
-            # Collect basic data
-            company_data = self.data_collector.collect_company_data(symbol, years=5)
-
-            # Calculate EPV
-            current_price = None
-            if company_data["market_data"]:
-                latest_data = max(company_data["market_data"], key=lambda x: x.date)
-                current_price = latest_data.price
-
-            epv_calculation = self.epv_calculator.calculate_epv(
-                symbol=symbol,
-                income_statements=company_data["income_statements"],
-                balance_sheets=company_data["balance_sheets"],
-                cash_flow_statements=company_data["cash_flow_statements"],
-                financial_ratios=company_data["financial_ratios"],
-                current_price=current_price,
-            )
-
-            # Return key metrics
-            return {
-                "symbol": symbol,
-                "company_name": (
-                    company_data["profile"].company_name
-                    if company_data["profile"]
-                    else symbol
-                ),
-                "epv_per_share": epv_calculation.epv_per_share,
-                "current_price": epv_calculation.current_price,
-                "margin_of_safety": epv_calculation.margin_of_safety,
-                "quality_score": epv_calculation.quality_score,
-                "normalized_earnings": epv_calculation.normalized_earnings,
-                "cost_of_capital": epv_calculation.cost_of_capital,
-                "growth_scenarios": epv_calculation.growth_scenarios,
-            }
+    async def quick_epv_async(self, symbol: str, as_of: Optional[date] = None) -> dict:
+        """
+        Async version of `quick_epv`
 
+        ``as_of`` is the day results are memoized under, defaulting to today.
+        """
+        try:
+            return await self._quick_epv(symbol, as_of)
         except Exception as e:
-            self.logger.error(f"Error in quick EPV for {symbol}: {e}")
+            self.logger.error("Error in quick EPV for %s: %s", symbol, e)
             raise
 
-    def batch_analysis(self, symbols: List[str], export_summary: bool = True) -> dict:
+    async def _quick_epv(self, symbol: str, as_of: Optional[date] = None) -> dict:
+        """Quick EPV without error logging, which is left to the caller"""
+
+        key = (symbol, as_of or date.today())
+        cached = self._quick_cache.get(key)
+        if cached is not None:
+            self.logger.debug("Quick EPV for %s served from memory", symbol)
+            return cached
+
+        self.logger.info("Quick EPV calculation for %s", symbol)
+
+        # Collect basic data
+        company_data = await self.data_collector.collect_company_data_async(
+            symbol, years=5
+        )
+
+        # Earnings are the one input EPV cannot do without; fail before
+        # the calculator hashes and walks the rest of the data
+        if not company_data["income_statements"]:
+            raise ValueError(f"No income statements available for {symbol}")
+
+        # Calculate EPV; the collector already took the latest close from
+        # its date-ordered history
+        epv_calculation = self.epv_calculator.calculate_epv(
+            symbol=symbol,
+            income_statements=company_data["income_statements"],
+            balance_sheets=company_data["balance_sheets"],
+            cash_flow_statements=company_data["cash_flow_statements"],
+            financial_ratios=company_data["financial_ratios"],
+            current_price=company_data["current_price"],
+        )
+
+        # Return key metrics
+        quick_results = {
+            "symbol": symbol,
+            "company_name": (
+                company_data["company_profile"].company_name
+                if company_data["company_profile"]
+                else symbol
+            ),
+            "epv_per_share": epv_calculation.epv_per_share,
+            "current_price": epv_calculation.current_price,
+            "margin_of_safety": epv_calculation.margin_of_safety,
+            "quality_score": epv_calculation.quality_score,
+            "normalized_earnings": epv_calculation.normalized_earnings,
+            "cost_of_capital": epv_calculation.cost_of_capital,
+            "growth_scenarios": epv_calculation.growth_scenarios,
+        }
+        self._quick_cache[key] = quick_results
+        return quick_results
+
+    def batch_analysis(
+        self,
+        symbols: List[str],
+        export_summary: bool = True,
+        max_concurrency: int = BATCH_MAX_CONCURRENCY,
+    ) -> dict:
         """
         Perform batch analysis on multiple stocks
 
         Args:
             symbols: List of stock symbols to analyze
             export_summary: Whether to export summary results
+            max_concurrency: Maximum number of symbols analyzed concurrently
 
         Returns:
             Dictionary with batch results
@@ -203,90 +376,91 @@ class EPVResearchPlatform:
             "summary_stats": {},
         }
 
-        self.logger.info(f"Starting batch analysis for {len(symbols)} symbols")
+        self.logger.info("Starting batch analysis for %d symbols", len(symbols))
+        # One date for the whole batch, even if it runs past midnight
+        today = date.today()
 
-        for symbol in symbols:
-            try:
-                quick_results = self.quick_epv(symbol)
-                results["results"][symbol] = quick_results
-                results["symbols_analyzed"].append(symbol)
-                results["successful_analyses"] += 1
-
-                self.logger.info(
-                    f"✓ {symbol}: EPV=${quick_results['epv_per_share']:.2f}, "
-                    f"Quality={quick_results['quality_score']:.2f}"
+        # Rows are written as symbols complete, so a partial export survives
+        # an interrupted batch
+        export = None
+        if export_summary:
+            export = BatchExport(
+                f"{EXPORT_DIR}/batch_analysis_{today.strftime('%Y%m%d')}.csv"
+            )
+        try:
+            outcomes = run_sync(
+                self._quick_epv_many(
+                    symbols,
+                    max_concurrency,
+                    as_of=today,
+                    on_success=export.write if export else None,
                 )
+            )
+        finally:
+            if export is not None:
+                export.close()
 
-            except Exception as e:
-                self.logger.error(f"✗ {symbol}: {e}")
+        # Report in input order regardless of completion order
+        for symbol in symbols:
+            outcome = outcomes[symbol]
+            results["results"][symbol] = outcome
+            if "error" in outcome:
                 results["failed_analyses"] += 1
-                results["results"][symbol] = {"error": str(e)}
+            else:
+                results["symbols_analyzed"].append(symbol)
+                results["successful_analyses"] += 1
 
         # Calculate summary statistics
         successful_results = [
             r for r in results["results"].values() if "error" not in r
         ]
         if successful_results:
-            epv_values = [
-                r["epv_per_share"] for r in successful_results if r["epv_per_share"]
-            ]
-            quality_scores = [
-                r["quality_score"] for r in successful_results if r["quality_score"]
-            ]
-            margins_of_safety = [
-                r["margin_of_safety"]
-                for r in successful_results
-                if r["margin_of_safety"] is not None
-            ]
-
-            results["summary_stats"] = {
-                "avg_epv": sum(epv_values) / len(epv_values) if epv_values else 0,
-                "avg_quality": (
-                    sum(quality_scores) / len(quality_scores) if quality_scores else 0
-                ),
-                "avg_margin_of_safety": (
-                    sum(margins_of_safety) / len(margins_of_safety)
-                    if margins_of_safety
-                    else 0
-                ),
-                "undervalued_count": len([m for m in margins_of_safety if m > 0]),
-                "high_quality_count": len([q for q in quality_scores if q > 0.7]),
-            }
+            results["summary_stats"] = summarize_batch(successful_results)
 
-        # Export summary if requested
-        if export_summary and successful_results:
-            import pandas as pd
-            from datetime import date
-
-            summary_data = []
-            for symbol, data in results["results"].items():
-                if "error" not in data:
-                    summary_data.append(
-                        {
-                            "Symbol": symbol,
-                            "Company": data["company_name"],
-                            "EPV_Per_Share": data["epv_per_share"],
-                            "Current_Price": data["current_price"],
-                            "Margin_of_Safety": data["margin_of_safety"],
-                            "Quality_Score": data["quality_score"],
-                            "Cost_of_Capital": data["cost_of_capital"],
-                        }
-                    )
-
-            if summary_data:
-                df = pd.DataFrame(summary_data)
-                filename = (
-                    f"exports/batch_analysis_{date.today().strftime('%Y%m%d')}.csv"
-                )
-                df.to_csv(filename, index=False)
-                results["export_file"] = filename
+        if export is not None and export.rows:
+            results["export_file"] = export.filename
 
         self.logger.info(
-            f"Batch analysis complete: {results['successful_analyses']} successful, "
-            f"{results['failed_analyses']} failed"
+            "Batch analysis complete: %d successful, %d failed",
+            results["successful_analyses"],
+            results["failed_analyses"],
         )
         return results
 
+    async def _quick_epv_many(
+        self,
+        symbols: List[str],
+        max_concurrency: int,
+        as_of: Optional[date] = None,
+        on_success: Optional[Callable[[str, dict], None]] = None,
+    ) -> Dict[str, dict]:
+        """
+        Quick EPV for each symbol concurrently, with errors as results
+
+        ``on_success`` is called with each successful result as it completes.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(symbol: str):
+            async with semaphore:
+                # Failures are logged once here, as the symbol's batch line
+                try:
+                    quick_results = await self._quick_epv(symbol, as_of)
+                except Exception as e:
+                    self.logger.error("✗ %s: %s", symbol, e)
+                    return symbol, {"error": str(e)}
+            self.logger.info(
+                "✓ %s: EPV=$%.2f, Quality=%.2f",
+                symbol,
+                quick_results["epv_per_share"],
+                quick_results["quality_score"],
+            )
+            if on_success is not None:
+                on_success(symbol, quick_results)
+            return symbol, quick_results
+
+        return dict(await asyncio.gather(*(run(symbol) for symbol in symbols)))
+
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
         return self.cache_manager.get_cache_stats()
@@ -367,9 +541,9 @@ def _handle_batch(platform: EPVResearchPlatform, args: argparse.Namespace):
     return 0
 
 
-def _handle_cache_stats(platform: EPVResearchPlatform, args: argparse.Namespace):
+def _handle_cache_stats(cache_manager: CacheManager, args: argparse.Namespace):
     """Handles the 'cache-stats' command"""
-    stats = platform.get_cache_stats()
+    stats = cache_manager.get_cache_stats()
     print("\n=== Cache Statistics ===")
     print(f"Total entries: {stats['total_entries']}")
     print(f"Total size: {stats['total_size_bytes']:,} bytes")
@@ -377,9 +551,9 @@ def _handle_cache_stats(platform: EPVResearchPlatform, args: argparse.Namespace)
     return 0
 
 
-def _handle_clear_cache(platform: EPVResearchPlatform, args: argparse.Namespace):
+def _handle_clear_cache(cache_manager: CacheManager, args: argparse.Namespace):
     """Handles the 'clear-cache' command"""
-    cleared = platform.clear_cache()
+    cleared = cache_manager.clear_all()
     print(f"Cleared {cleared} cache entries")
     return 0
 
@@ -387,7 +561,7 @@ def _handle_clear_cache(platform: EPVResearchPlatform, args: argparse.Namespace)
 def _handle_web(platform: EPVResearchPlatform, args: argparse.Namespace):
     """Handles the 'web' command"""
     print(f"Starting web interface on port {args.port}...")
-    from ui.web_app import create_app
+    from src.ui.web_app import create_app
 
     app = create_app(platform)
     app.run(host="127.0.0.1", port=args.port, debug=True)
@@ -399,7 +573,7 @@ def _handle_api(platform: EPVResearchPlatform, args: argparse.Namespace):
     print(f"Starting API server on port {args.port}...")
     import uvicorn
 
-    uvicorn.run("api.main:app", host="0.0.0.0", port=args.port, reload=True)
+    uvicorn.run("src.api.main:app", host="0.0.0.0", port=args.port, reload=True)
     return 0
 
 
@@ -458,23 +632,27 @@ def main():
     # Setup
     setup_directories()
     setup_logging()
-
-    platform = EPVResearchPlatform()
+    install_uvloop()
 
     handlers = {
         "analyze": _handle_analyze,
         "quick": _handle_quick,
         "batch": _handle_batch,
-        "cache-stats": _handle_cache_stats,
-        "clear-cache": _handle_clear_cache,
         "web": _handle_web,
         "api": _handle_api,
     }
+    # Cache maintenance only needs the cache, not the full platform
+    cache_handlers = {
+        "cache-stats": _handle_cache_stats,
+        "clear-cache": _handle_clear_cache,
+    }
 
     try:
+        if args.command in cache_handlers:
+            return cache_handlers[args.command](CacheManager(), args)
         handler = handlers.get(args.command)
         if handler:
-            return handler(platform, args)
+            return handler(EPVResearchPlatform(), args)
         else:
             print(f"Error: Unknown command '{args.command}'")
             return 1
@@ -6,8 +6,10 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Any
 from datetime import datetime, date
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class FinancialStatement:
     """Base class for financial statements"""
 
@@ -19,7 +21,7 @@ class FinancialStatement:
     filing_date: Optional[date] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomeStatement(FinancialStatement):
     """Income statement data"""
 
@@ -37,7 +39,7 @@ class IncomeStatement(FinancialStatement):
     earnings_growth: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class BalanceSheet(FinancialStatement):
     """Balance sheet data"""
 
@@ -56,7 +58,7 @@ class BalanceSheet(FinancialStatement):
     book_value_per_share: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CashFlowStatement(FinancialStatement):
     """Cash flow statement data"""
 
@@ -68,7 +70,7 @@ class CashFlowStatement(FinancialStatement):
     dividends_paid: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialRatios:
     """Calculated financial ratios"""
 
@@ -99,7 +101,7 @@ class FinancialRatios:
     receivables_turnover: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Market data for a security"""
 
@@ -114,7 +116,7 @@ class MarketData:
     beta: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EPVCalculation:
     """Earnings Power Value calculation results"""
 
@@ -145,7 +147,7 @@ class EPVCalculation:
     risk_factors: Optional[List[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CompanyProfile:
     """Company profile and fundamental data"""
 
@@ -178,7 +180,7 @@ class CompanyProfile:
     last_updated: datetime = field(default_factory=datetime.now)
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchReport:
     """Comprehensive research report for a company"""
 
@@ -269,3 +271,78 @@ class PortfolioPosition:
         if self.current_price == 0:
             return 0.0
         return ((self.epv_per_share - self.current_price) / self.current_price) * 100
+
+
+class PortfolioArray:
+    """
+    Column-wise view of a list of positions for portfolio-wide calculations
+
+    Each field is a float64 array with one entry per position, so aggregates
+    are single vectorised expressions rather than a loop over position objects.
+    """
+
+    def __init__(
+        self,
+        symbols: List[str],
+        shares: np.ndarray,
+        avg_cost: np.ndarray,
+        current_price: np.ndarray,
+        epv_per_share: np.ndarray,
+    ):
+        self.symbols = symbols
+        self.shares = shares
+        self.avg_cost = avg_cost
+        self.current_price = current_price
+        self.epv_per_share = epv_per_share
+
+    @classmethod
+    def from_positions(cls, positions: List[PortfolioPosition]) -> "PortfolioArray":
+        count = len(positions)
+
+        def column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (getattr(pos, attr) for pos in positions), dtype=np.float64, count=count
+            )
+
+        return cls(
+            symbols=[pos.symbol for pos in positions],
+            shares=column("shares"),
+            avg_cost=column("avg_cost"),
+            current_price=column("current_price"),
+            epv_per_share=column("epv_per_share"),
+        )
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    @property
+    def market_value(self) -> np.ndarray:
+        return self.shares * self.current_price
+
+    @property
+    def cost_basis(self) -> np.ndarray:
+        return self.shares * self.avg_cost
+
+    @property
+    def epv_total(self) -> np.ndarray:
+        return self.shares * self.epv_per_share
+
+    @property
+    def epv_margin_of_safety(self) -> np.ndarray:
+        """Per-position margin of safety in percent, 0 where the price is 0"""
+        margin = np.zeros_like(self.current_price)
+        np.divide(
+            self.epv_per_share - self.current_price,
+            self.current_price,
+            out=margin,
+            where=self.current_price != 0,
+        )
+        return margin * 100
+
+    def weights(self) -> np.ndarray:
+        """Market value weights, all zero for a portfolio with no value"""
+        market_value = self.market_value
+        total = market_value.sum()
+        if total > 0:
+            return market_value / total
+        return np.zeros_like(market_value)
@@ -3,18 +3,51 @@ PDF report generator
 """
 
 import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
 from jinja2 import Environment, FileSystemLoader
 from weasyprint import HTML
 
+# Shared so each template is parsed once per process; templates ship with the
+# package, so there is no need to stat them for changes on every render
+_TEMPLATE_ENV = Environment(
+    loader=FileSystemLoader(os.path.join(os.path.dirname(__file__), "templates")),
+    auto_reload=False,
+)
+
 
 def build_report(data: dict, template_name: str, output_path: str) -> str:
     """Build a PDF report from a template and data."""
-    template_dir = os.path.join(os.path.dirname(__file__), "templates")
-    env = Environment(loader=FileSystemLoader(template_dir))
-    template = env.get_template(template_name)
+    template = _TEMPLATE_ENV.get_template(template_name)
     html_out = template.render(data)
 
     pdf_path = os.path.join(output_path, f"{data['symbol']}_report.pdf")
     HTML(string=html_out).write_pdf(pdf_path)
 
     return pdf_path
+
+
+def _render_one(args: Tuple[dict, str, str]) -> str:
+    """Process pool entry point for build_reports"""
+    return build_report(*args)
+
+
+def build_reports(
+    items: List[dict],
+    template_name: str,
+    output_path: str,
+    workers: Optional[int] = None,
+) -> List[str]:
+    """
+    Build a PDF report for each data dict, rendering in separate processes.
+
+    WeasyPrint layout is CPU-bound and not thread-safe, so batches are spread
+    over a process pool. Paths are returned in the order of ``items``.
+    """
+    if len(items) <= 1:
+        return [build_report(data, template_name, output_path) for data in items]
+
+    jobs = [(data, template_name, output_path) for data in items]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_render_one, jobs))
@@ -3,16 +3,31 @@ Web Interface for EPV Research Platform
 Interactive dashboard for stock analysis and EPV calculations
 """
 
+import math
+import uuid
+from operator import itemgetter
+from typing import List, Optional
+
 import dash
 from dash import dcc, html, Input, Output, State, dash_table
-import plotly.express as px
-import pandas as pd
+import plotly.graph_objects as go
+
+from src.utils.cache_manager import TTLCache
+
+# Batch results are paged on the server; only one page is sent to the browser
+BATCH_TABLE_PAGE_SIZE = 25
 
 
 def create_app(platform):
     """Create and configure the Dash web application"""
 
-    app = dash.Dash(__name__, title="EPV Research Platform")
+    # The batch results table is created by a callback, so its paging
+    # callback is registered before the table exists
+    app = dash.Dash(
+        __name__, title="EPV Research Platform", suppress_callback_exceptions=True
+    )
+    # Raw batch table rows per run, for serving pages and sorts
+    batch_tables = TTLCache(maxsize=32, ttl=3600)
 
     # Custom CSS
     app.layout = html.Div(
@@ -287,13 +302,30 @@ def create_app(platform):
                 )
 
             results = platform.batch_analysis(symbols, export_summary=False)
-            return create_batch_results_display(results)
+            run_id = uuid.uuid4().hex
+            rows = batch_table_rows(results)
+            batch_tables[run_id] = rows
+            return create_batch_results_display(results, rows, run_id)
 
         except Exception as e:
             return html.Div(
                 f"Batch analysis error: {str(e)}", style={"color": "#e74c3c"}
             )
 
+    @app.callback(
+        Output("batch-results-table", "data"),
+        Input("batch-results-table", "page_current"),
+        Input("batch-results-table", "sort_by"),
+        State("batch-run-id", "data"),
+        prevent_initial_call=True,
+    )
+    def page_batch_results(page_current, sort_by, run_id):
+        rows = batch_tables.get(run_id)
+        if rows is None:
+            # The run has expired from the server; keep what is displayed
+            return dash.no_update
+        return batch_table_page(rows, page_current or 0, sort_by)
+
     return app
 
 
@@ -431,24 +463,19 @@ def create_quick_results_display(results):
         style={"marginBottom": "30px"},
     )
 
-    # Growth scenarios chart
+    # Growth scenarios chart; a handful of bars, so SVG rendering is fine
     if results["growth_scenarios"]:
-        scenarios_df = pd.DataFrame(
-            [
-                {"Scenario": scenario.replace("_", " ").title(), "Value": value}
-                for scenario, value in results["growth_scenarios"].items()
-            ]
-        )
-
+        scenarios = results["growth_scenarios"]
+        values = list(scenarios.values())
         scenarios_chart = dcc.Graph(
-            figure=px.bar(
-                scenarios_df,
-                x="Scenario",
-                y="Value",
-                title="EPV under Different Growth Scenarios",
-                color="Value",
-                color_continuous_scale="viridis",
+            figure=go.Figure(
+                go.Bar(
+                    x=[scenario.replace("_", " ").title() for scenario in scenarios],
+                    y=values,
+                    marker={"color": values, "colorscale": "Viridis"},
+                )
             ).update_layout(
+                title="EPV under Different Growth Scenarios",
                 xaxis_title="Growth Scenario",
                 yaxis_title="Value per Share ($)",
                 showlegend=False,
@@ -723,7 +750,102 @@ def create_full_results_display(results):
     )
 
 
-def create_batch_results_display(results):
+def create_batch_overview_chart(results):
+    """EPV against price for every priced symbol, coloured by quality score"""
+    points = [
+        (symbol, data)
+        for symbol, data in results["results"].items()
+        if "error" not in data and data["current_price"]
+    ]
+    if not points:
+        return html.Div()
+
+    # WebGL keeps the scatter responsive for batches of thousands of symbols
+    figure = go.Figure(
+        go.Scattergl(
+            x=[data["current_price"] for _, data in points],
+            y=[data["epv_per_share"] for _, data in points],
+            text=[symbol for symbol, _ in points],
+            mode="markers",
+            marker={
+                "color": [data["quality_score"] for _, data in points],
+                "colorscale": "Viridis",
+                "colorbar": {"title": "Quality"},
+            },
+            hovertemplate=(
+                "%{text}<br>Price: $%{x:.2f}<br>EPV: $%{y:.2f}<extra></extra>"
+            ),
+        )
+    ).update_layout(
+        title="EPV vs Current Price",
+        xaxis_title="Current Price ($)",
+        yaxis_title="EPV per Share ($)",
+        uirevision="batch-overview",
+    )
+    return dcc.Graph(figure=figure)
+
+
+def batch_table_rows(results) -> List[dict]:
+    """Unformatted table rows for the successful symbols of a batch run"""
+    return [
+        {
+            "Symbol": symbol,
+            "Company": data["company_name"],
+            "EPV": data["epv_per_share"],
+            "Current Price": data["current_price"],
+            "Margin of Safety": data["margin_of_safety"],
+            "Quality Score": data["quality_score"],
+            "Cost of Capital": data["cost_of_capital"],
+        }
+        for symbol, data in results["results"].items()
+        if "error" not in data
+    ]
+
+
+def _format_batch_row(row: dict) -> dict:
+    return {
+        "Symbol": row["Symbol"],
+        "Company": row["Company"],
+        "EPV": f"${row['EPV']:.2f}",
+        "Current Price": (
+            f"${row['Current Price']:.2f}" if row["Current Price"] else "N/A"
+        ),
+        "Margin of Safety": (
+            f"{row['Margin of Safety']:.1f}%"
+            if row["Margin of Safety"] is not None
+            else "N/A"
+        ),
+        "Quality Score": f"{row['Quality Score']:.2f}",
+        "Cost of Capital": f"{row['Cost of Capital']:.2%}",
+    }
+
+
+def batch_table_page(
+    rows: List[dict],
+    page_current: int,
+    sort_by: Optional[List[dict]] = None,
+    page_size: int = BATCH_TABLE_PAGE_SIZE,
+) -> List[dict]:
+    """
+    One display page of batch rows, sorted on the underlying values
+
+    Sorting happens before formatting so numbers order numerically, and
+    missing values always sort last. Only the rows on the page are formatted.
+    """
+    for sort in reversed(sort_by or []):
+        column = sort["column_id"]
+        present = [row for row in rows if row[column] is not None]
+        missing = [row for row in rows if row[column] is None]
+        present.sort(key=itemgetter(column), reverse=sort["direction"] == "desc")
+        rows = present + missing
+
+    start = page_current * page_size
+    return [_format_batch_row(row) for row in rows[start : start + page_size]]
+
+
+def create_batch_results_display(
+    results, rows: List[dict], run_id: Optional[str] = None
+):
     """Create display for batch analysis results"""
 
     # Summary stats
@@ -816,32 +938,9 @@ def create_batch_results_display(results):
         style={"marginBottom": "30px"},
     )
 
-    # Results table
-    table_data = []
-    for symbol, data in results["results"].items():
-        if "error" not in data:
-            table_data.append(
-                {
-                    "Symbol": symbol,
-                    "Company": data["company_name"],
-                    "EPV": f"${data['epv_per_share']:.2f}",
-                    "Current Price": (
-                        f"${data['current_price']:.2f}"
-                        if data["current_price"]
-                        else "N/A"
-                    ),
-                    "Margin of Safety": (
-                        f"{data['margin_of_safety']:.1f}%"
-                        if data["margin_of_safety"] is not None
-                        else "N/A"
-                    ),
-                    "Quality Score": f"{data['quality_score']:.2f}",
-                    "Cost of Capital": f"{data['cost_of_capital']:.2%}",
-                }
-            )
-
     results_table = dash_table.DataTable(
-        data=table_data,
+        id="batch-results-table",
+        data=batch_table_page(rows, 0),
         columns=[
             {"name": "Symbol", "id": "Symbol"},
             {"name": "Company", "id": "Company"},
@@ -860,13 +959,21 @@ def create_batch_results_display(results):
         style_data_conditional=[
             {"if": {"row_index": "odd"}, "backgroundColor": "#f8f9fa"}
         ],
-        sort_action="native",
+        page_action="custom",
+        page_current=0,
+        page_size=BATCH_TABLE_PAGE_SIZE,
+        page_count=max(1, math.ceil(len(rows) / BATCH_TABLE_PAGE_SIZE)),
+        sort_action="custom",
+        sort_mode="single",
+        sort_by=[],
     )
 
     return html.Div(
         [
+            dcc.Store(id="batch-run-id", data=run_id),
             html.H3("Batch Analysis Results", style={"color": "#2c3e50"}),
             summary_cards,
+            create_batch_overview_chart(results),
             html.H4(
                 "Detailed Results", style={"color": "#2c3e50", "marginBottom": "15px"}
             ),
@@ -0,0 +1,45 @@
+"""
+Run coroutines from synchronous code on a shared background event loop
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Return the bridge loop, starting its daemon thread on first use."""
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="async-runner", daemon=True
+            ).start()
+    return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion and return its result.
+
+    Unlike asyncio.run, this works when the calling thread already runs an
+    event loop (Jupyter, FastAPI handlers), and it reuses one long-lived loop
+    instead of creating and tearing one down per call. Loop-bound resources
+    such as the shared HTTP client's pooled connections stay valid between
+    calls as a result.
+    """
+    loop = _background_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError("run_sync cannot be called from its own event loop")
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
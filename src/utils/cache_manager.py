@@ -3,14 +3,18 @@ Cache management utility for the EPV Research Platform
 """
 
 import pickle
-import json
 import os
-from typing import Any, Optional
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
 from pathlib import Path
 from datetime import datetime, timedelta
 import hashlib
 import logging
 
+import orjson
+
 
 class CacheManager:
     """
@@ -55,7 +59,7 @@ class CacheManager:
 
             # Store the data
             with open(cache_path, "wb") as f:
-                pickle.dump(value, f)
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
 
             # Store metadata
             metadata = {
@@ -65,8 +69,8 @@ class CacheManager:
                 "size_bytes": os.path.getsize(cache_path),
             }
 
-            with open(metadata_path, "w") as f:
-                json.dump(metadata, f)
+            with open(metadata_path, "wb") as f:
+                f.write(orjson.dumps(metadata))
 
             self.logger.debug(f"Cached data for key: {key}")
             return True
@@ -94,8 +98,8 @@ class CacheManager:
                 return None
 
             # Check if cache has expired
-            with open(metadata_path, "r") as f:
-                metadata = json.load(f)
+            with open(metadata_path, "rb") as f:
+                metadata = orjson.loads(f.read())
 
             expires_at = datetime.fromisoformat(metadata["expires_at"])
             if datetime.now() > expires_at:
@@ -159,8 +163,8 @@ class CacheManager:
         try:
             for metadata_file in self.cache_dir.glob("*.meta"):
                 try:
-                    with open(metadata_file, "r") as f:
-                        metadata = json.load(f)
+                    with open(metadata_file, "rb") as f:
+                        metadata = orjson.loads(f.read())
 
                     expires_at = datetime.fromisoformat(metadata["expires_at"])
                     if datetime.now() > expires_at:
@@ -204,8 +208,8 @@ class CacheManager:
 
             for metadata_file in metadata_files:
                 try:
-                    with open(metadata_file, "r") as f:
-                        metadata = json.load(f)
+                    with open(metadata_file, "rb") as f:
+                        metadata = orjson.loads(f.read())
 
                     # Check size
                     if "size_bytes" in metadata:
@@ -262,3 +266,52 @@ class CacheManager:
             self.logger.info(f"Cleared all cache ({cleared_count} entries)")
 
         return cleared_count
+
+
+class TTLCache:
+    """
+    Bounded in-memory cache whose entries expire after a fixed time-to-live
+
+    Entries are evicted lazily on access once expired, and the least recently
+    written entry is dropped when the cache is full. Safe to share between
+    threads (e.g. the threaded server behind the Dash app).
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing or expired"""
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if time.monotonic() >= expires_at:
+                self._data.pop(key, None)
+                return default
+            return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+_MISSING = object()
@@ -2,6 +2,7 @@
 Rate limiting utility for API calls
 """
 
+import asyncio
 import time
 import threading
 from datetime import datetime, timedelta
@@ -29,7 +30,26 @@ class RateLimiter:
 
     def wait_if_needed(self) -> None:
         """
-        Wait if necessary to respect rate limits
+        Wait if necessary to respect rate limits (blocking; for sync callers)
+        """
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+
+    async def acquire(self) -> None:
+        """
+        Wait if necessary to respect rate limits without blocking the event loop
+        """
+        wait_seconds = self._reserve()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+
+    def _reserve(self) -> float:
+        """
+        Reserve the next request slot and return the seconds until it opens
+
+        The slot is recorded immediately, so concurrent callers queue behind
+        each other instead of all waking at the same instant.
         """
         with self.lock:
             now = datetime.now()
@@ -37,35 +57,38 @@ class RateLimiter:
             # Clean old requests
             self._clean_old_requests(now)
 
+            wait_seconds = 0.0
+
             # Check daily limit
             if len(self.daily_requests) >= self.requests_per_day:
-                oldest_daily = self.daily_requests[0]
-                wait_until = oldest_daily + timedelta(days=1)
-                wait_seconds = (wait_until - now).total_seconds()
-
-                if wait_seconds > 0:
+                wait_until = self.daily_requests[-self.requests_per_day] + timedelta(
+                    days=1
+                )
+                daily_wait = (wait_until - now).total_seconds()
+                if daily_wait > 0:
                     self.logger.warning(
-                        f"Daily rate limit reached. Waiting {wait_seconds:.1f} seconds"
+                        f"Daily rate limit reached. Waiting {daily_wait:.1f} seconds"
                     )
-                    time.sleep(wait_seconds)
-                    return
+                    wait_seconds = daily_wait
 
             # Check minute limit
             if len(self.minute_requests) >= self.requests_per_minute:
-                oldest_minute = self.minute_requests[0]
-                wait_until = oldest_minute + timedelta(minutes=1)
-                wait_seconds = (wait_until - now).total_seconds()
-
-                if wait_seconds > 0:
+                wait_until = self.minute_requests[
+                    -self.requests_per_minute
+                ] + timedelta(minutes=1)
+                minute_wait = (wait_until - now).total_seconds()
+                if minute_wait > wait_seconds:
                     self.logger.debug(
-                        f"Minute rate limit reached. Waiting {wait_seconds:.1f} seconds"
+                        f"Minute rate limit reached. Waiting {minute_wait:.1f} seconds"
                     )
-                    time.sleep(wait_seconds)
+                    wait_seconds = minute_wait
+
+            # Record this request at the time it will actually be sent
+            slot = now + timedelta(seconds=wait_seconds)
+            self.minute_requests.append(slot)
+            self.daily_requests.append(slot)
 
-            # Record this request
-            now = datetime.now()  # Update time after potential wait
-            self.minute_requests.append(now)
-            self.daily_requests.append(now)
+            return wait_seconds
 
     def _clean_old_requests(self, now: datetime) -> None:
         """Remove requests older than the tracking window"""
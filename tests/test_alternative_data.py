@@ -0,0 +1,407 @@
+"""
+Tests for alternative data collection and intelligence scoring
+"""
+
+from datetime import date, timedelta
+
+import httpx
+import numpy as np
+import pytest
+
+from src.data import alternative_data
+from src.data.alternative_data import (
+    AlternativeDataCollector,
+    ESGDataProvider,
+    InsiderTradingTable,
+    SECFiling,
+    esg_rating,
+    weighted_sentiment,
+    _score_kernel,
+    _intelligence_score_kernel,
+    BUY,
+    SELL,
+)
+from src.utils.cache_manager import CacheManager
+
+
+@pytest.fixture
+def cache_manager(tmp_path):
+    return CacheManager(cache_dir=str(tmp_path))
+
+
+@pytest.fixture
+def collector(cache_manager):
+    with AlternativeDataCollector(cache_manager=cache_manager) as collector:
+        yield collector
+
+
+class TestCollectComprehensiveData:
+    """Test cases for AlternativeDataCollector.collect_comprehensive_data"""
+
+    def test_collects_all_providers(self, collector):
+        """Every provider should contribute a data source entry"""
+        data = collector.collect_comprehensive_data("AAPL")
+
+        assert data["symbol"] == "AAPL"
+        assert list(data["data_sources"]) == [
+            "sec_filings",
+            "insider_trading",
+            "esg_data",
+            "sentiment_data",
+            "management_data",
+        ]
+
+    def test_intelligence_scores_in_unit_range(self, collector):
+        """Composite scores should all be present and finite"""
+        data = collector.collect_comprehensive_data("MSFT")
+        scores = data["intelligence_scores"]
+
+        for key in [
+            "esg_score",
+            "sentiment_score",
+            "management_score",
+            "insider_trading_score",
+            "filing_quality_score",
+            "overall_alternative_score",
+        ]:
+            assert key in scores
+            assert isinstance(scores[key], float)
+
+    def test_failing_provider_yields_empty_source(self, collector, monkeypatch):
+        """A provider raising should not abort the remaining providers"""
+
+        def boom(symbol, as_of=None):
+            raise RuntimeError("provider down")
+
+        monkeypatch.setattr(collector.esg_provider, "collect_data", boom)
+        data = collector.collect_comprehensive_data("AAPL")
+
+        assert data["data_sources"]["esg_data"] == {}
+        assert data["data_sources"]["sec_filings"]["sec_filings"]
+
+    def test_as_of_shared_by_all_providers(self, collector):
+        """Every provider should date its data from the requested as-of date"""
+        as_of = date(2023, 6, 30)
+        data = collector.collect_comprehensive_data("AAPL", as_of=as_of)
+        sources = data["data_sources"]
+
+        assert data["as_of"] == as_of
+        assert sources["esg_data"]["esg_scoring"].assessment_date == as_of
+        assert sources["sentiment_data"]["sentiment_analysis"].analysis_date == as_of
+        assert (
+            sources["management_data"]["management_assessment"].assessment_date == as_of
+        )
+        assert all(f.filing_date < as_of for f in sources["sec_filings"]["sec_filings"])
+        transaction_dates = sources["insider_trading"][
+            "insider_trading"
+        ].transaction_date
+        assert (transaction_dates < np.datetime64(as_of, "D")).all()
+
+
+class TestCollectMany:
+    """Test cases for AlternativeDataCollector.collect_many"""
+
+    def test_scores_frame_one_row_per_symbol(self, collector):
+        """Duplicate symbols should collapse to a single row"""
+        scores, results = collector.collect_many(["AAPL", "MSFT", "AAPL"])
+
+        assert list(scores.index) == ["AAPL", "MSFT"]
+        assert "overall_alternative_score" in scores.columns
+        assert set(results) == {"AAPL", "MSFT"}
+        assert results["MSFT"]["symbol"] == "MSFT"
+
+
+class TestSharedClient:
+    """Test cases for HTTP client sharing between providers"""
+
+    def test_providers_share_collector_client(self, collector):
+        """All providers should reuse the collector's connection pool"""
+        clients = {
+            id(provider._client)
+            for provider in [
+                collector.sec_provider,
+                collector.insider_provider,
+                collector.esg_provider,
+                collector.sentiment_provider,
+                collector.management_provider,
+            ]
+        }
+        assert clients == {id(collector._client)}
+
+    def test_injected_client_not_closed(self, cache_manager):
+        """Closing the collector should leave a caller-owned client open"""
+        client = httpx.Client()
+        AlternativeDataCollector(client=client, cache_manager=cache_manager).close()
+
+        assert not client.is_closed
+        client.close()
+
+
+class TestProviderCache:
+    """Test cases for per-provider result caching"""
+
+    def test_collect_data_served_from_cache(self, cache_manager):
+        """A second collect for the same symbol should return the cached result"""
+        with ESGDataProvider(cache_manager=cache_manager) as provider:
+            first = provider.collect_data("AAPL")
+            second = provider.collect_data("AAPL")
+
+        assert second == first
+
+    def test_cache_keyed_by_as_of(self, cache_manager):
+        """Different as-of dates should not share a cached result"""
+        with ESGDataProvider(cache_manager=cache_manager) as provider:
+            first = provider.collect_data("AAPL", date(2024, 1, 2))
+            second = provider.collect_data("AAPL", date(2024, 1, 3))
+
+        assert first["esg_scoring"].assessment_date == date(2024, 1, 2)
+        assert second["esg_scoring"].assessment_date == date(2024, 1, 3)
+
+    def test_current_data_outlives_the_day(self, cache_manager, monkeypatch):
+        """Today's result should still be served tomorrow, within its expiry"""
+        with ESGDataProvider(cache_manager=cache_manager) as provider:
+            first = provider.collect_data("AAPL")
+
+            class Tomorrow(date):
+                @classmethod
+                def today(cls):
+                    return date.today() + timedelta(days=1)
+
+            monkeypatch.setattr(alternative_data, "date", Tomorrow)
+            second = provider.collect_data("AAPL")
+
+        assert second == first
+
+    def test_empty_result_not_cached(self, cache_manager, monkeypatch):
+        """Failed (empty) collections should be retried rather than cached"""
+        with ESGDataProvider(cache_manager=cache_manager) as provider:
+
+            def boom(symbol, as_of):
+                raise RuntimeError("vendor down")
+
+            monkeypatch.setattr(provider, "_get_esg_scores", boom)
+            assert provider.collect_data("AAPL") == {"esg_scoring": None}
+
+            monkeypatch.undo()
+            assert provider.collect_data("AAPL")["esg_scoring"] is not None
+
+
+    def test_mock_data_seeded_per_symbol_and_date(self):
+        """Uncached collections should repeat for a (symbol, as_of) pair"""
+        as_of = date(2024, 1, 2)
+        with ESGDataProvider() as first, ESGDataProvider() as second:
+            scores = [
+                provider.collect_data(symbol, day)["esg_scoring"].environmental_score
+                for provider, symbol, day in [
+                    (first, "AAPL", as_of),
+                    (second, "AAPL", as_of),
+                    (first, "AAPL", as_of + timedelta(days=1)),
+                    (first, "MSFT", as_of),
+                ]
+            ]
+
+        assert scores[0] == scores[1]
+        assert len(set(scores)) == 3
+
+def make_insider_table(transaction_types, significance_scores):
+    """Build an InsiderTradingTable with the given type codes and significance"""
+    n = len(transaction_types)
+    shares = np.full(n, 1000.0)
+    prices = np.full(n, 100.0)
+    return InsiderTradingTable(
+        symbol="AAPL",
+        insider_name=np.array([f"Insider {i}" for i in range(n)]),
+        title=np.array(["CEO"] * n),
+        transaction_date=np.full(n, np.datetime64("2024-01-02", "D")),
+        transaction_type=np.array(transaction_types, dtype=np.int8),
+        shares_transacted=shares,
+        price_per_share=prices,
+        shares_owned_after=shares * 5,
+        transaction_value=shares * prices,
+        ownership_change_pct=np.full(n, 10.0),
+        significance_score=np.array(significance_scores, dtype=np.float64),
+    )
+
+
+class TestInsiderTradingTable:
+    """Test cases for the columnar insider trading store"""
+
+    def test_to_records_round_trip(self):
+        """Rows should materialise with decoded transaction types and dates"""
+        table = make_insider_table([BUY, SELL], [0.5, 0.8])
+        records = table.to_records()
+
+        assert len(table) == 2
+        assert [r.transaction_type for r in records] == [BUY, SELL]
+        assert [str(r.transaction_type) for r in records] == ["Buy", "Sell"]
+        assert records[0].transaction_date == date(2024, 1, 2)
+        assert records[1].transaction_value == 100000.0
+
+    def test_empty_table_is_falsy(self):
+        """An empty table should behave like an empty list"""
+        table = InsiderTradingTable.empty("AAPL")
+
+        assert not table
+        assert table.to_records() == []
+
+    def test_insider_score_from_columns(self, collector):
+        """Buy/sell signal should be computed from the type column"""
+        table = make_insider_table([BUY, SELL, SELL, SELL], [0.5] * 4)
+        scores = collector._calculate_intelligence_scores(
+            {"insider_trading": {"insider_trading": table}}
+        )
+
+        # 0.25 buys - 0.75 sells * 0.5 + 0.5
+        assert scores["insider_trading_score"] == pytest.approx(0.375)
+
+    def test_no_activity_is_neutral(self, collector):
+        """Symbols without insider or filing data should score neutral"""
+        scores = collector._calculate_intelligence_scores(
+            {
+                "insider_trading": {
+                    "insider_trading": InsiderTradingTable.empty("AAPL")
+                },
+                "sec_filings": {"sec_filings": []},
+            }
+        )
+
+        assert scores["insider_trading_score"] == 0.5
+        assert scores["filing_quality_score"] == 0.5
+
+    def test_heavy_selling_red_flag(self, collector):
+        """More than two significant sells should raise a red flag"""
+        table = make_insider_table([SELL, SELL, SELL, BUY], [0.8, 0.9, 0.75, 0.95])
+        flags = collector.get_red_flags(
+            "AAPL", {"insider_trading": {"insider_trading": table}}
+        )
+
+        assert "Multiple significant insider sales" in flags
+
+    def test_red_flags_deduplicated(self, collector):
+        """The same flag raised by several filings should appear once"""
+        flagged = SECFiling(
+            symbol="AAPL",
+            filing_type="8-K",
+            filing_date=date(2024, 1, 2),
+            period_end_date=None,
+            accession_number="AAPL-8K",
+            document_url="https://sec.gov/filings/AAPL-8K.htm",
+            red_flags=["Unscheduled filing - potential material event"],
+        )
+        flags = collector.get_red_flags(
+            "AAPL", {"sec_filings": {"sec_filings": [flagged, flagged]}}
+        )
+
+        assert flags == ["Unscheduled filing - potential material event"]
+
+
+def make_filing(sentiment_score):
+    """Build a minimal SECFiling with the given sentiment score"""
+    return SECFiling(
+        symbol="AAPL",
+        filing_type="10-Q",
+        filing_date=date(2024, 1, 2),
+        period_end_date=None,
+        accession_number="AAPL-10Q",
+        document_url="https://sec.gov/filings/AAPL-10Q.htm",
+        sentiment_score=sentiment_score,
+    )
+
+
+class TestSECFiling:
+    """Test cases for the SECFiling record"""
+
+    def test_key_metrics_view(self):
+        """key_metrics should expose the typed metric fields as a dict"""
+        filing = make_filing(0.1)
+
+        assert filing.key_metrics == {
+            "revenue_growth": 0.0,
+            "margin_improvement": 0.0,
+            "debt_level": "",
+            "guidance_provided": False,
+        }
+
+
+class TestFilingQualityScore:
+    """Test cases for the SEC filing sentiment reduction"""
+
+    def test_missing_scores_ignored(self, collector):
+        """Filings without a sentiment score should not drag the mean"""
+        filings = [make_filing(0.2), make_filing(None), make_filing(0.4)]
+        scores = collector._calculate_intelligence_scores(
+            {"sec_filings": {"sec_filings": filings}}
+        )
+
+        assert scores["filing_quality_score"] == pytest.approx((0.3 + 1) / 2)
+
+    def test_all_scores_missing_defaults_neutral(self, collector):
+        """No usable sentiment should fall back to a neutral score"""
+        filings = [make_filing(None), make_filing(None)]
+        scores = collector._calculate_intelligence_scores(
+            {"sec_filings": {"sec_filings": filings}}
+        )
+
+        assert scores["filing_quality_score"] == 0.5
+
+
+class TestScoreKernel:
+    """Test cases for the numeric intelligence score kernel"""
+
+    def test_missing_inputs_are_neutral(self):
+        """NaN scalars and empty arrays should all map to 0.5"""
+        result = _intelligence_score_kernel(
+            np.empty(0, dtype=np.int8), np.empty(0), np.nan, np.nan, np.nan
+        )
+
+        assert result == pytest.approx((0.5,) * 6)
+
+    def test_compiled_matches_python(self):
+        """The compiled kernel should agree with the plain Python function"""
+        args = (
+            np.array([BUY, SELL, SELL], dtype=np.int8),
+            np.array([0.1, np.nan, -0.3]),
+            0.7,
+            72.0,
+            0.2,
+        )
+
+        assert _intelligence_score_kernel(*args) == pytest.approx(_score_kernel(*args))
+
+
+class TestESGRating:
+    """Test cases for ESG rating bucket lookup"""
+
+    @pytest.mark.parametrize(
+        "score,expected",
+        [
+            (95.0, "AAA"),
+            (80.0, "AAA"),
+            (79.9, "AA"),
+            (70.0, "AA"),
+            (65.0, "A"),
+            (60.0, "A"),
+            (50.0, "BBB"),
+            (49.9, "BB"),
+        ],
+    )
+    def test_scalar_buckets(self, score, expected):
+        """Thresholds should be inclusive lower bounds"""
+        assert esg_rating(score) == expected
+
+    def test_vectorised_buckets(self):
+        """An array of scores should be rated in one call"""
+        ratings = esg_rating(np.array([45.0, 55.0, 85.0]))
+        assert ratings.tolist() == ["BB", "BBB", "AAA"]
+
+
+class TestWeightedSentiment:
+    """Test cases for the overall sentiment weighting"""
+
+    def test_batch_matches_scalar(self):
+        """The (N, 3) batch path should agree with the per-symbol formula"""
+        components = np.array([[0.2, -0.1, 0.3], [-0.3, 0.4, 0.0]])
+        expected = [weighted_sentiment(tuple(row)) for row in components.tolist()]
+
+        assert weighted_sentiment(components) == pytest.approx(expected)
+        assert expected[0] == pytest.approx(0.2 * 0.4 - 0.1 * 0.3 + 0.3 * 0.3)
@@ -0,0 +1,62 @@
+"""Unit tests for the sync-to-async bridge."""
+
+import asyncio
+
+import pytest
+
+from src.utils import async_runner
+from src.utils.async_runner import run_sync
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+def test_run_sync_reuses_one_loop():
+    """Consecutive calls should run on the same long-lived loop."""
+    assert run_sync(current_loop()) is run_sync(current_loop())
+
+
+@pytest.mark.asyncio
+async def test_run_sync_inside_running_loop():
+    """Calling from a running loop should not raise like asyncio.run does."""
+
+    async def add(a, b):
+        await asyncio.sleep(0)
+        return a + b
+
+    assert run_sync(add(2, 3)) == 5
+    assert run_sync(current_loop()) is not asyncio.get_running_loop()
+
+
+def test_run_sync_propagates_exceptions():
+    """Errors raised by the coroutine should reach the caller."""
+
+    async def fail():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        run_sync(fail())
+
+
+def test_background_loop_follows_event_loop_policy(monkeypatch):
+    """The bridge loop should come from the policy installed before first use."""
+    created = []
+
+    class RecordingPolicy(asyncio.DefaultEventLoopPolicy):
+        def new_event_loop(self):
+            loop = super().new_event_loop()
+            created.append(loop)
+            return loop
+
+    monkeypatch.setattr(async_runner, "_loop", None)
+    previous = asyncio.get_event_loop_policy()
+    asyncio.set_event_loop_policy(RecordingPolicy())
+    try:
+        loop = run_sync(current_loop())
+    finally:
+        asyncio.set_event_loop_policy(previous)
+        if async_runner._loop is not None:
+            async_runner._loop.call_soon_threadsafe(async_runner._loop.stop)
+
+    assert created == [loop]
@@ -0,0 +1,48 @@
+"""Unit tests for the cache utilities."""
+
+from src.utils import cache_manager
+from src.utils.cache_manager import TTLCache
+
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    """Entries should disappear once their time-to-live has elapsed."""
+    now = [1000.0]
+    monkeypatch.setattr(cache_manager.time, "monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    cache["AAPL"] = 150.0
+    now[0] += 59
+    assert cache.get("AAPL") == 150.0
+
+    now[0] += 1
+    assert "AAPL" not in cache
+    assert len(cache) == 0
+
+
+def test_ttl_cache_bounded_size():
+    """The oldest entry should be evicted when the cache is full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["AAPL"] = 1
+    cache["MSFT"] = 2
+    cache["AAPL"] = 3  # rewrite makes AAPL the newest entry
+    cache["GOOG"] = 4
+
+    assert "MSFT" not in cache
+    assert cache.get("AAPL") == 3
+    assert cache.get("GOOG") == 4
+
+
+def test_ttl_cache_expiry_tolerates_concurrent_eviction(monkeypatch):
+    """An expired entry already evicted elsewhere should read as a miss."""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache["run-1"] = "table"
+
+    def evicting_clock():
+        # Another reader dropped the expired entry between lookup and delete
+        cache._data.pop("run-1", None)
+        return float("inf")
+
+    monkeypatch.setattr(cache_manager.time, "monotonic", evicting_clock)
+
+    assert cache.get("run-1") is None
+    assert len(cache) == 0
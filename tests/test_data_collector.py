@@ -0,0 +1,254 @@
+"""Unit tests for the DataCollector orchestration."""
+
+import asyncio
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data import data_collector
+from src.data.data_collector import (
+    CASH_FLOW_ROWS,
+    DataCollector,
+    YahooFinanceSource,
+    _market_data_from_history,
+    _parse_statements,
+    _split_download,
+    _statement_columns,
+)
+from src.models.financial_models import BalanceSheet, IncomeStatement
+from src.utils.cache_manager import CacheManager, TTLCache
+
+
+@pytest.fixture
+def collector(tmp_path):
+    return DataCollector(cache_manager=CacheManager(cache_dir=str(tmp_path)))
+
+
+@pytest.mark.asyncio
+async def test_peer_comparison_collects_concurrently(collector, monkeypatch):
+    """Peers should be in flight together, bounded by max_concurrency."""
+    in_flight = 0
+    peak = 0
+
+    async def fake_collect(symbol, years=10):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if symbol == "BAD":
+            raise RuntimeError("provider down")
+        return {"symbol": symbol}
+
+    prefetched = []
+
+    async def fake_batch(symbols, start_date, end_date):
+        prefetched.extend(symbols)
+        return {}
+
+    monkeypatch.setattr(collector, "collect_company_data_async", fake_collect)
+    monkeypatch.setattr(collector.yahoo_finance, "get_market_data_batch", fake_batch)
+    data = await collector.get_peer_comparison_data_async(
+        "AAPL", ["MSFT", "GOOG", "BAD", "AMZN"], max_concurrency=3
+    )
+
+    assert data["target_data"] == {"symbol": "AAPL"}
+    assert list(data["peers"]) == ["MSFT", "GOOG", "AMZN"]
+    assert peak == 3
+    # All histories are requested together before the per-symbol fan-out
+    assert prefetched == ["AAPL", "MSFT", "GOOG", "BAD", "AMZN"]
+
+
+def test_statement_columns_match_safe_get():
+    """The reindexed extraction should agree with per-cell _safe_get lookups."""
+    columns = pd.to_datetime(["2024-12-31", "2023-12-31", "2022-12-31"])
+    cash_flow = pd.DataFrame(
+        [[100.0, 90.0, 80.0], [-20.0, np.nan, -15.0], [-5.0, -6.0, -7.0]],
+        index=[
+            "Total Cash From Operating Activities",
+            "Capital Expenditures",
+            "Unrelated Row",
+        ],
+        columns=columns,
+    )
+
+    extracted = _statement_columns(cash_flow, CASH_FLOW_ROWS, years=2)
+    source = YahooFinanceSource()
+
+    assert [col for col, _ in extracted] == list(columns[:2])
+    for col, fields in extracted:
+        for field, label in CASH_FLOW_ROWS:
+            assert fields[field] == source._safe_get(cash_flow, label, col)
+    assert extracted[1][1]["capital_expenditures"] is None
+    assert extracted[0][1]["financing_cash_flow"] is None
+
+
+def test_statement_columns_empty_frame():
+    """Missing or empty statements should yield no columns."""
+    assert _statement_columns(None, CASH_FLOW_ROWS, years=5) == []
+    assert _statement_columns(pd.DataFrame(), CASH_FLOW_ROWS, years=5) == []
+
+
+@pytest.mark.asyncio
+async def test_ticker_info_fetched_once_for_profile_and_quote(monkeypatch):
+    """Profile and quote lookups should share one Ticker.info fetch."""
+    fetches = []
+
+    class FakeTicker:
+        def __init__(self, symbol, session=None):
+            self.symbol = symbol
+
+        @property
+        def info(self):
+            fetches.append(self.symbol)
+            return {"shortName": "Apple Inc.", "regularMarketPrice": 190.5}
+
+    monkeypatch.setattr(data_collector.yf, "Ticker", FakeTicker)
+    monkeypatch.setattr(data_collector, "_yf_info_cache", TTLCache(10, 60))
+    source = YahooFinanceSource()
+
+    profile = await source.get_company_profile("AAPL")
+    quote = await source.get_quote("AAPL")
+
+    assert profile.company_name == "Apple Inc."
+    assert quote["price"] == 190.5
+    assert fetches == ["AAPL"]
+
+
+def test_parse_statements_derives_free_cash_flow():
+    """Cash flow statements should carry OCF + capex as free cash flow."""
+    columns = pd.to_datetime(["2024-12-31"])
+    cash_flow = pd.DataFrame(
+        [[100.0], [-20.0]],
+        index=["Total Cash From Operating Activities", "Capital Expenditures"],
+        columns=columns,
+    )
+
+    income, balance, cash = _parse_statements(
+        "AAPL", None, pd.DataFrame(), cash_flow, 5
+    )
+
+    assert income == [] and balance == []
+    assert cash[0].fiscal_year == 2024
+    assert cash[0].free_cash_flow == 80.0
+
+
+@pytest.mark.asyncio
+async def test_statements_served_from_per_fetch_cache(tmp_path, monkeypatch):
+    """A warm statements cache should skip the yfinance fetch entirely."""
+    calls = []
+
+    async def fake_fetch(symbol, years):
+        calls.append((symbol, years))
+        return [], [], [{"symbol": symbol}]
+
+    source = YahooFinanceSource(cache_manager=CacheManager(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(source, "_fetch_financial_statements", fake_fetch)
+
+    first = await source.get_financial_statements("AAPL", 5)
+    second = await source.get_financial_statements("AAPL", 5)
+
+    assert second == first
+    assert calls == [("AAPL", 5)]
+
+
+@pytest.mark.asyncio
+async def test_empty_statements_not_cached(tmp_path, monkeypatch):
+    """Failed (empty) fetches should be retried rather than cached."""
+    calls = []
+
+    async def failing_fetch(symbol, years):
+        calls.append(symbol)
+        return [], [], []
+
+    source = YahooFinanceSource(cache_manager=CacheManager(cache_dir=str(tmp_path)))
+    monkeypatch.setattr(source, "_fetch_financial_statements", failing_fetch)
+
+    await source.get_financial_statements("AAPL", 5)
+    await source.get_financial_statements("AAPL", 5)
+
+    assert calls == ["AAPL", "AAPL"]
+
+
+def test_market_data_from_history():
+    """History rows should map to MarketData with missing volume as None."""
+    hist = pd.DataFrame(
+        {"Close": [101.5, 102.0], "Volume": [1_000_000, np.nan]},
+        index=pd.DatetimeIndex(["2024-01-02", "2024-01-03"], tz="America/New_York"),
+    )
+
+    rows = _market_data_from_history("AAPL", hist)
+
+    assert [r.date for r in rows] == [date(2024, 1, 2), date(2024, 1, 3)]
+    assert [r.price for r in rows] == [101.5, 102.0]
+    assert rows[0].volume == 1_000_000 and isinstance(rows[0].volume, int)
+    assert rows[1].volume is None
+    assert _market_data_from_history("AAPL", None) == []
+
+
+def make_download_frame():
+    """A yf.download(group_by="ticker") style frame for two symbols"""
+    index = pd.DatetimeIndex(["2024-01-02", "2024-01-03"])
+    columns = pd.MultiIndex.from_product([["AAPL", "MSFT"], ["Close", "Volume"]])
+    return pd.DataFrame(
+        [[101.0, 1000, 370.0, 2000], [102.0, 1100, np.nan, np.nan]],
+        index=index,
+        columns=columns,
+    )
+
+
+def test_split_download_per_symbol():
+    """Each symbol should get its own history with empty dates dropped."""
+    frames = _split_download(make_download_frame(), ["AAPL", "MSFT", "GOOG"])
+
+    assert set(frames) == {"AAPL", "MSFT"}
+    assert len(frames["AAPL"]) == 2
+    assert len(frames["MSFT"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_market_data_batch_warms_single_symbol_cache(tmp_path, monkeypatch):
+    """One download should serve later get_market_data calls from cache."""
+    downloads = []
+
+    def fake_download(tickers, **kwargs):
+        downloads.append(list(tickers))
+        return make_download_frame()
+
+    monkeypatch.setattr(data_collector.yf, "download", fake_download)
+    source = YahooFinanceSource(cache_manager=CacheManager(cache_dir=str(tmp_path)))
+    start, end = date(2024, 1, 1), date(2024, 1, 4)
+
+    batch = await source.get_market_data_batch(["AAPL", "MSFT"], start, end)
+    single = await source.get_market_data("MSFT", start, end)
+
+    assert downloads == [["AAPL", "MSFT"]]
+    assert [m.price for m in batch["AAPL"]] == [101.0, 102.0]
+    assert single == batch["MSFT"]
+
+
+def test_calculate_ratios_matches_by_fiscal_year(collector):
+    """Ratios should pair each income statement with its year's balance sheet."""
+    kwargs = {"symbol": "AAPL", "period": "annual"}
+    income = [
+        IncomeStatement(fiscal_year=2024, revenue=200.0, net_income=20.0, **kwargs),
+        IncomeStatement(fiscal_year=2023, revenue=100.0, net_income=10.0, **kwargs),
+        IncomeStatement(fiscal_year=2022, revenue=90.0, net_income=9.0, **kwargs),
+    ]
+    balance = [
+        BalanceSheet(fiscal_year=2023, total_equity=50.0, total_assets=100.0, **kwargs),
+        BalanceSheet(fiscal_year=2024, total_equity=80.0, **kwargs),
+        BalanceSheet(fiscal_year=2024, total_equity=999.0, **kwargs),
+    ]
+
+    ratios = collector._calculate_ratios(
+        {"symbol": "AAPL", "income_statements": income, "balance_sheets": balance}
+    )
+
+    # 2022 has no balance sheet; the first 2024 sheet wins over the duplicate
+    assert [r.roe for r in ratios] == [25.0, 20.0]
+    assert ratios[0].roa is None
+    assert ratios[1].roa == 10.0
+    assert ratios[1].net_margin == 10.0
@@ -0,0 +1,199 @@
+"""Unit tests for the database schema and ingestion helpers."""
+
+import importlib
+import sys
+import types
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import Integer, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, mapped_column
+
+from src.models.financial_models import MarketData as MarketDataPoint
+
+
+def _stub_auth_models():
+    """A src.auth.models stand-in: a bare Base and a User with just an id."""
+
+    class Base(DeclarativeBase):
+        pass
+
+    class User(Base):
+        __tablename__ = "user"
+        id = mapped_column(Integer, primary_key=True)
+
+    auth_models = types.ModuleType("src.auth.models")
+    auth_models.Base = Base
+    auth_models.User = User
+    return auth_models
+
+
+def _forget_modules(names):
+    """Drop modules from sys.modules and from their parent packages."""
+    for name in names:
+        del sys.modules[name]
+        parent, _, child = name.rpartition(".")
+        if parent in sys.modules and hasattr(sys.modules[parent], child):
+            delattr(sys.modules[parent], child)
+
+
+@pytest.fixture(scope="module")
+def db():
+    """
+    src.auth.db and the domain tables, mapped on a bare Base when the
+    installed fastapi-users cannot map the User model.
+
+    fastapi-users-db-sqlalchemy no longer gives SQLAlchemyBaseUserTable an id
+    column, so importing src.auth.models fails in such environments; the
+    domain tables only need the shared Base and a ``user.id`` to point at.
+    Anything imported against the stand-in is dropped again on teardown, so
+    later test modules see the real src.auth.models.
+    """
+    before = set(sys.modules)
+    with pytest.MonkeyPatch.context() as mp:
+        try:
+            importlib.import_module("src.auth.models")
+            stubbed = False
+        except ArgumentError:
+            mp.setitem(sys.modules, "src.auth.models", _stub_auth_models())
+            stubbed = True
+        try:
+            yield types.SimpleNamespace(
+                auth_db=importlib.import_module("src.auth.db"),
+                ingest=importlib.import_module("src.db.ingest"),
+                models=importlib.import_module("src.db.models"),
+            )
+        finally:
+            if stubbed:
+                _forget_modules(
+                    name
+                    for name in set(sys.modules) - before
+                    if name.startswith(("src.auth.", "src.db"))
+                    and name != "src.auth.models"
+                )
+
+
+async def make_engine(*tables):
+    """An in-memory aiosqlite engine with just the given tables created"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        metadata = tables[0].metadata
+        await conn.run_sync(metadata.create_all, tables=list(tables))
+    return engine
+
+
+def price_history(start, days):
+    return [
+        MarketDataPoint(
+            symbol="AAPL",
+            date=start + timedelta(days=i),
+            price=100.0 + i,
+            volume=1000 + i,
+        )
+        for i in range(days)
+    ]
+
+
+def test_schema_ddl_honours_postgres_only_indexes(db):
+    """SQLite DDL should leave out the JSONB indexes that Postgres gets."""
+    auth_db = db.auth_db
+    tables = tuple(auth_db.Base.metadata.tables)
+
+    sqlite_ddl = "\n".join(auth_db._schema_ddl(tables, sqlite.dialect()))
+    postgres_ddl = "\n".join(auth_db._schema_ddl(tables, postgresql.dialect()))
+
+    assert "CREATE TABLE IF NOT EXISTS financial_statement" in sqlite_ddl
+    assert "ix_fm_lookup" in sqlite_ddl
+    assert "ix_fin_stmt_" not in sqlite_ddl
+    for name in ("ix_fin_stmt_data_path", "ix_fin_stmt_net_income"):
+        assert name in postgres_ddl
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_market_data_chunks_and_skips_existing(db, monkeypatch):
+    """Rows should insert across chunks, and re-ingesting skips stored dates."""
+    ingest, MarketData = db.ingest, db.models.MarketData
+    monkeypatch.setattr(ingest, "MARKET_DATA_CHUNK_SIZE", 4)
+    engine = await make_engine(MarketData.__table__)
+    history = price_history(date(2024, 1, 1), 10)
+
+    async with AsyncSession(engine) as session, session.begin():
+        batch_sizes = []
+        execute = session.execute
+
+        async def recording_execute(statement, params=None, **kwargs):
+            batch_sizes.append(len(params))
+            return await execute(statement, params, **kwargs)
+
+        session.execute = recording_execute
+        first = await ingest.bulk_upsert_market_data(session, 1, history)
+        del session.execute
+        # Five overlapping dates and three new ones
+        second = await ingest.bulk_upsert_market_data(
+            session, 1, history[5:] + price_history(date(2024, 1, 11), 3)
+        )
+        other_company = await ingest.bulk_upsert_market_data(session, 2, history[:2])
+
+    async with AsyncSession(engine) as session:
+        stored = await session.scalar(
+            select(func.count())
+            .select_from(MarketData)
+            .where(MarketData.company_id == 1)
+        )
+        latest = await session.scalar(
+            select(MarketData.price).order_by(MarketData.date.desc()).limit(1)
+        )
+    await engine.dispose()
+
+    assert batch_sizes == [4, 4, 2]
+    assert (first, second, other_company) == (10, 3, 2)
+    assert stored == 13
+    assert latest == 102.0
+
+
+@pytest.mark.asyncio
+async def test_financial_metrics_follow_statement_flushes(db):
+    """Flushing a statement should insert, then replace, its numeric metrics."""
+    FinancialStatement = db.models.FinancialStatement
+    FinancialMetric = db.models.FinancialMetric
+    engine = await make_engine(FinancialStatement.__table__, FinancialMetric.__table__)
+
+    async def stored_metrics(session):
+        rows = await session.execute(
+            select(FinancialMetric.metric_name, FinancialMetric.value).order_by(
+                FinancialMetric.metric_name
+            )
+        )
+        return rows.all()
+
+    async with AsyncSession(engine) as session, session.begin():
+        statement = FinancialStatement(
+            company_id=1,
+            statement_type="income",
+            period="annual",
+            fiscal_year=2024,
+            data={
+                "revenue": 100,
+                "net_income": 12.5,
+                "currency": "USD",
+                "audited": True,
+            },
+        )
+        session.add(statement)
+        await session.flush()
+        inserted = await stored_metrics(session)
+
+        statement.data = {"revenue": 120}
+        await session.flush()
+        updated = await stored_metrics(session)
+        fiscal_years = await session.scalars(select(FinancialMetric.fiscal_year))
+        years = set(fiscal_years)
+    await engine.dispose()
+
+    # Strings and booleans are not metrics
+    assert inserted == [("net_income", 12.5), ("revenue", 100.0)]
+    assert updated == [("revenue", 120.0)]
+    assert years == {2024}
@@ -0,0 +1,106 @@
+"""Unit tests for the EPV calculator."""
+
+import numpy as np
+import pytest
+
+from src.analysis.epv_calculator import (
+    EPVCalculator,
+    _earnings_kernel,
+    _normalized_earnings_kernel,
+)
+from src.models.financial_models import BalanceSheet, IncomeStatement
+
+KWARGS = {"symbol": "AAPL", "period": "annual"}
+
+
+@pytest.fixture
+def calculator(monkeypatch):
+    monkeypatch.setattr(EPVCalculator, "_cache", {})
+    return EPVCalculator()
+
+
+@pytest.fixture
+def statements():
+    income = [
+        IncomeStatement(
+            fiscal_year=2024 - i,
+            revenue=1000.0,
+            operating_income=200.0,
+            net_income=150.0,
+            shares_outstanding=100.0,
+            **KWARGS,
+        )
+        for i in range(5)
+    ]
+    balance = [
+        BalanceSheet(
+            fiscal_year=2024 - i, total_assets=2000.0, total_equity=1000.0, **KWARGS
+        )
+        for i in range(5)
+    ]
+    return income, balance
+
+
+def test_epv_memoised_while_inputs_unchanged(calculator, statements):
+    """Identical inputs should return the memoised calculation."""
+    income, balance = statements
+
+    first = calculator.calculate_epv("AAPL", income, balance, [], [], 20.0)
+    second = calculator.calculate_epv("AAPL", list(income), balance, [], [], 20.0)
+
+    assert second is first
+
+
+def test_epv_recomputed_when_inputs_change(calculator, statements):
+    """A new price or statement should not be served a stale calculation."""
+    income, balance = statements
+
+    first = calculator.calculate_epv("AAPL", income, balance, [], [], 20.0)
+    repriced = calculator.calculate_epv("AAPL", income, balance, [], [], 10.0)
+
+    assert repriced is not first
+    assert repriced.current_price == 10.0
+    assert repriced.margin_of_safety > first.margin_of_safety
+
+
+def reference_normalized_earnings(net_incomes, operating_incomes):
+    """The original list-and-numpy formulation of normalized earnings"""
+    avg_net_income = np.mean(net_incomes) if net_incomes else 0
+    if len(net_incomes) >= 3:
+        weights = np.linspace(1, 0.5, len(net_incomes))
+        weighted_avg = np.average(net_incomes, weights=weights / weights.sum())
+    else:
+        weighted_avg = avg_net_income
+    median_earnings = np.median(net_incomes) if net_incomes else 0
+    avg_operating_income = np.mean(operating_incomes) if operating_incomes else 0
+    if avg_operating_income > 0:
+        normalized = 0.6 * avg_operating_income * 0.7 + 0.4 * weighted_avg
+    else:
+        normalized = 0.6 * weighted_avg + 0.4 * median_earnings
+    normalized *= 0.9
+    if normalized <= 0:
+        return max(avg_net_income, 0) * 0.5
+    return normalized
+
+
+@pytest.mark.parametrize(
+    "net_incomes, operating_incomes, fell_back",
+    [
+        (
+            [150.0, 120.0, 90.0, 200.0, 80.0],
+            [210.0, 180.0, 150.0, 260.0, 120.0],
+            False,
+        ),
+        ([150.0, -120.0, 90.0], [], False),
+        ([50.0, 40.0], [-30.0, -10.0], False),
+        ([-50.0, -40.0, -20.0], [-30.0], True),
+        ([], [], True),
+    ],
+)
+def test_earnings_kernel_matches_reference(net_incomes, operating_incomes, fell_back):
+    """Compiled and pure-Python kernels should agree with the numpy formula."""
+    expected = reference_normalized_earnings(net_incomes, operating_incomes)
+    arrays = (np.array(net_incomes, dtype=float), np.array(operating_incomes))
+
+    for kernel in (_earnings_kernel, _normalized_earnings_kernel):
+        assert kernel(*arrays) == (pytest.approx(expected, rel=1e-12), fell_back)
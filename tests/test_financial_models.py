@@ -0,0 +1,35 @@
+"""Unit tests for the portfolio position models."""
+
+import numpy as np
+import pytest
+
+from src.models.financial_models import PortfolioArray, PortfolioPosition
+
+
+@pytest.fixture
+def positions():
+    return [
+        PortfolioPosition("STOCK_A", 1000, 95.0, 100.0, 120.0),
+        PortfolioPosition("STOCK_B", 800, 85.0, 90.0, 85.0),
+        PortfolioPosition("STOCK_C", 500, 125.0, 0.0, 150.0),
+    ]
+
+
+def test_portfolio_array_matches_positions(positions):
+    """Column-wise values should equal the per-position properties."""
+    holdings = PortfolioArray.from_positions(positions)
+
+    assert len(holdings) == 3
+    assert holdings.symbols == ["STOCK_A", "STOCK_B", "STOCK_C"]
+    for attr in ("market_value", "cost_basis", "epv_total", "epv_margin_of_safety"):
+        expected = [getattr(pos, attr) for pos in positions]
+        np.testing.assert_allclose(getattr(holdings, attr), expected)
+
+
+def test_portfolio_array_weights(positions):
+    """Weights should follow market value and be zero for a worthless book."""
+    weights = PortfolioArray.from_positions(positions).weights()
+    np.testing.assert_allclose(weights, [100_000 / 172_000, 72_000 / 172_000, 0.0])
+
+    empty = PortfolioArray.from_positions([positions[2]])
+    np.testing.assert_array_equal(empty.weights(), [0.0])
@@ -2,11 +2,22 @@
 Unit tests for the DataGateway and data providers.
 """
 
+import asyncio
+
+import httpx
 import pytest
 from unittest.mock import MagicMock, AsyncMock
 
 from src.data.data_gateway import DataGateway
-from src.data.data_collector import YahooFinanceSource, AlphaVantageSource, FredSource
+from src.data.data_collector import (
+    ALPHA_VANTAGE_HOST,
+    HOST_CONCURRENCY,
+    YahooFinanceSource,
+    AlphaVantageSource,
+    FredSource,
+    close_http_client,
+    get_http_client,
+)
 
 
 @pytest.fixture
@@ -44,7 +55,9 @@ async def test_get_quote_success_primary(
     )
     quote = await gateway.get_quote("AAPL")
     assert quote is not None
-    assert quote["provider"] == "YahooFinance"
+    assert quote.provider == "YahooFinance"
+    assert quote.price == 150.0
+    assert quote.change == 0.0
 
 
 @pytest.mark.asyncio
@@ -58,7 +71,7 @@ async def test_get_quote_fallback(
     )
     quote = await gateway.get_quote("AAPL")
     assert quote is not None
-    assert quote["provider"] == "AlphaVantage"
+    assert quote.provider == "AlphaVantage"
 
 
 @pytest.mark.asyncio
@@ -73,3 +86,94 @@ async def test_get_quote_all_fail(
     )
     quote = await gateway.get_quote("AAPL")
     assert quote is None
+
+
+@pytest.mark.asyncio
+async def test_alpha_vantage_reuses_client():
+    """Repeated quotes should go through the source's persistent client."""
+    calls = []
+
+    def handler(request):
+        calls.append(request.url.params["symbol"])
+        assert request.url.params["function"] == "GLOBAL_QUOTE"
+        assert request.url.params["apikey"] == "key&with=specials"
+        return httpx.Response(
+            200,
+            json={"Global Quote": {"01. symbol": "AAPL", "05. price": "151.25"}},
+        )
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    source = AlphaVantageSource(api_key="key&with=specials", client=client)
+
+    for _ in range(2):
+        quote = await source.get_quote("AAPL")
+        assert quote["price"] == 151.25
+
+    await source.aclose()
+    assert calls == ["AAPL", "AAPL"]
+    # An injected client belongs to the caller and is left open
+    assert not client.is_closed
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_sources_share_process_client():
+    """Sources without an injected client should share one connection pool."""
+    alpha = AlphaVantageSource(api_key="demo")
+    fred = FredSource(api_key="demo")
+
+    assert alpha.client is fred.client is get_http_client()
+
+    await close_http_client()
+    assert alpha.client is get_http_client()
+    assert not alpha.client.is_closed
+    await close_http_client()
+
+
+@pytest.mark.asyncio
+async def test_get_quote_fastest_provider_wins(
+    mock_yahoo_source, mock_alpha_vantage_source, mock_fred_source
+):
+    """A slow primary should not delay the quote; it is cancelled instead."""
+    cancelled = asyncio.Event()
+
+    async def slow_quote(symbol):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    mock_yahoo_source.get_quote = slow_quote
+    gateway = DataGateway(
+        providers=[mock_yahoo_source, mock_alpha_vantage_source, mock_fred_source]
+    )
+
+    quote = await asyncio.wait_for(gateway.get_quote("AAPL"), timeout=1)
+    assert quote.provider == "AlphaVantage"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_alpha_vantage_host_concurrency_bounded():
+    """Concurrent quotes should not exceed the per-host request cap."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(
+            200,
+            json={"Global Quote": {"01. symbol": "AAPL", "05. price": "151.25"}},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        source = AlphaVantageSource(api_key="demo", client=client)
+        quotes = await asyncio.gather(*(source.get_quote("AAPL") for _ in range(6)))
+
+    assert all(q["price"] == 151.25 for q in quotes)
+    assert peak == HOST_CONCURRENCY[ALPHA_VANTAGE_HOST]
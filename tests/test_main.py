@@ -0,0 +1,279 @@
+"""Unit tests for the platform entry point helpers."""
+
+import asyncio
+import csv
+import logging
+from datetime import date, datetime
+from types import SimpleNamespace
+
+import orjson
+import pytest
+
+from src.main import (
+    QUICK_CACHE_MAX_SIZE,
+    BatchExport,
+    EPVResearchPlatform,
+    JsonLogFormatter,
+    summarize_batch,
+)
+from src.models.financial_models import CompanyProfile
+from src.utils.cache_manager import TTLCache
+
+
+def test_summarize_batch():
+    """Averages skip missing values; counts use the quality/MoS thresholds."""
+    results = [
+        {"epv_per_share": 100.0, "quality_score": 0.8, "margin_of_safety": 25.0},
+        {"epv_per_share": 50.0, "quality_score": 0.5, "margin_of_safety": -10.0},
+        {"epv_per_share": None, "quality_score": 0.0, "margin_of_safety": None},
+    ]
+
+    stats = summarize_batch(results)
+
+    assert stats["avg_epv"] == 75.0
+    assert stats["avg_quality"] == pytest.approx(0.65)
+    assert stats["avg_margin_of_safety"] == 7.5
+    assert stats["undervalued_count"] == 1
+    assert stats["high_quality_count"] == 1
+
+
+def test_summarize_batch_without_values():
+    """No usable values should give zero averages rather than dividing by zero."""
+    stats = summarize_batch(
+        [{"epv_per_share": None, "quality_score": None, "margin_of_safety": None}]
+    )
+
+    assert stats == {
+        "avg_epv": 0,
+        "avg_quality": 0,
+        "avg_margin_of_safety": 0,
+        "undervalued_count": 0,
+        "high_quality_count": 0,
+    }
+
+
+def test_batch_analysis_runs_symbols_concurrently(monkeypatch):
+    """Symbols should overlap in flight and be reported in input order."""
+    platform = EPVResearchPlatform.__new__(EPVResearchPlatform)
+    platform.logger = logging.getLogger("test")
+    in_flight = 0
+    peak = 0
+    dates = set()
+
+    async def fake_quick_epv(symbol, as_of=None):
+        nonlocal in_flight, peak
+        dates.add(as_of)
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        if symbol == "BAD":
+            raise RuntimeError("no data")
+        return {
+            "symbol": symbol,
+            "epv_per_share": 10.0,
+            "quality_score": 0.8,
+            "margin_of_safety": 5.0,
+        }
+
+    monkeypatch.setattr(platform, "_quick_epv", fake_quick_epv)
+    symbols = ["MSFT", "BAD", "AAPL", "GOOG"]
+
+    results = platform.batch_analysis(symbols, export_summary=False, max_concurrency=3)
+
+    assert peak == 3
+    assert list(results["results"]) == symbols
+    assert results["symbols_analyzed"] == ["MSFT", "AAPL", "GOOG"]
+    assert results["successful_analyses"] == 3
+    assert results["failed_analyses"] == 1
+    assert results["results"]["BAD"] == {"error": "no data"}
+    assert results["summary_stats"]["high_quality_count"] == 3
+    # Every symbol is memoized under the same batch date
+    assert dates == {date.today()}
+
+
+def test_batch_analysis_exports_summary_csv(monkeypatch, tmp_path):
+    """The export should hold one row per successful symbol, blanks for None."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "exports").mkdir()
+    platform = EPVResearchPlatform.__new__(EPVResearchPlatform)
+    platform.logger = logging.getLogger("test")
+
+    async def fake_quick_epv(symbol, as_of=None):
+        if symbol == "BAD":
+            raise RuntimeError("no data")
+        return {
+            "symbol": symbol,
+            "company_name": f"{symbol} Inc.",
+            "epv_per_share": 12.5,
+            "current_price": 10.0,
+            "margin_of_safety": 25.0,
+            "quality_score": 0.8,
+            "cost_of_capital": None,
+        }
+
+    monkeypatch.setattr(platform, "_quick_epv", fake_quick_epv)
+
+    results = platform.batch_analysis(["MSFT", "BAD", "AAPL"])
+
+    with open(tmp_path / results["export_file"], newline="") as f:
+        rows = list(csv.reader(f))
+    assert rows[0] == [
+        "Symbol",
+        "Company",
+        "EPV_Per_Share",
+        "Current_Price",
+        "Margin_of_Safety",
+        "Quality_Score",
+        "Cost_of_Capital",
+    ]
+    # Rows are written in completion order
+    assert sorted(rows[1:]) == [
+        ["AAPL", "AAPL Inc.", "12.5", "10.0", "25.0", "0.8", ""],
+        ["MSFT", "MSFT Inc.", "12.5", "10.0", "25.0", "0.8", ""],
+    ]
+
+
+def test_batch_analysis_skips_export_without_successes(monkeypatch, tmp_path, caplog):
+    """No CSV should be created when every symbol fails, each logged once."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "exports").mkdir()
+    platform = EPVResearchPlatform.__new__(EPVResearchPlatform)
+    platform.logger = logging.getLogger("test")
+
+    async def failing_quick_epv(symbol, as_of=None):
+        raise RuntimeError("no data")
+
+    monkeypatch.setattr(platform, "_quick_epv", failing_quick_epv)
+
+    with caplog.at_level(logging.ERROR, logger="test"):
+        results = platform.batch_analysis(["BAD"])
+
+    assert "export_file" not in results
+    assert list((tmp_path / "exports").iterdir()) == []
+    assert [r.getMessage() for r in caplog.records] == ["✗ BAD: no data"]
+
+
+def test_batch_export_appends_after_close(tmp_path):
+    """A write after close() should reopen the file without losing rows."""
+    row = {
+        "company_name": "AAPL Inc.",
+        "epv_per_share": 12.5,
+        "current_price": 10.0,
+        "margin_of_safety": 25.0,
+        "quality_score": 0.8,
+        "cost_of_capital": 0.1,
+    }
+    export = BatchExport(str(tmp_path / "batch.csv"))
+    export.write("AAPL", row)
+    export.close()
+    export.write("MSFT", row)
+    export.close()
+
+    with open(tmp_path / "batch.csv", newline="") as f:
+        rows = list(csv.reader(f))
+    assert [r[0] for r in rows] == ["Symbol", "AAPL", "MSFT"]
+    assert export.rows == 2
+
+
+def collected_company_data(symbol, income_statements):
+    """A collect_company_data_async result, with the collector's key names"""
+    return {
+        "symbol": symbol,
+        "collection_date": datetime.now(),
+        "company_profile": CompanyProfile(symbol=symbol, company_name=f"{symbol} Inc."),
+        "income_statements": income_statements,
+        "balance_sheets": [],
+        "cash_flow_statements": [],
+        "market_data": [],
+        "financial_ratios": [],
+        "current_price": 10.0,
+        "market_cap": None,
+    }
+
+
+def make_quick_platform(collected, calculate_epv, cache_size=QUICK_CACHE_MAX_SIZE):
+    """A platform whose collector records symbols and returns statements"""
+    platform = EPVResearchPlatform.__new__(EPVResearchPlatform)
+    platform.logger = logging.getLogger("test")
+    platform._quick_cache = TTLCache(maxsize=cache_size, ttl=60)
+
+    async def fake_collect(symbol, years=10):
+        collected.append(symbol)
+        statements = [] if symbol == "ILLIQ" else [SimpleNamespace(fiscal_year=2024)]
+        return collected_company_data(symbol, statements)
+
+    platform.data_collector = SimpleNamespace(collect_company_data_async=fake_collect)
+    platform.epv_calculator = SimpleNamespace(calculate_epv=calculate_epv)
+    return platform
+
+
+QUICK_CALCULATION = SimpleNamespace(
+    epv_per_share=12.5,
+    current_price=10.0,
+    margin_of_safety=25.0,
+    quality_score=0.8,
+    normalized_earnings=100.0,
+    cost_of_capital=0.1,
+    growth_scenarios={},
+)
+
+
+def test_quick_epv_memoized_per_day():
+    """Repeat quick EPV calls for a symbol should reuse the first result."""
+    collected = []
+    platform = make_quick_platform(collected, lambda **kwargs: QUICK_CALCULATION)
+
+    first = platform.quick_epv("AAPL")
+    second = platform.quick_epv("AAPL")
+    platform.quick_epv("MSFT")
+
+    assert second is first
+    assert first["company_name"] == "AAPL Inc."
+    assert first["epv_per_share"] == 12.5
+    assert collected == ["AAPL", "MSFT"]
+
+
+def test_quick_epv_memo_is_bounded():
+    """The oldest memoized symbol should be evicted once the cache is full."""
+    collected = []
+    platform = make_quick_platform(
+        collected, lambda **kwargs: QUICK_CALCULATION, cache_size=1
+    )
+
+    platform.quick_epv("AAPL")
+    platform.quick_epv("MSFT")
+    platform.quick_epv("AAPL")
+
+    assert collected == ["AAPL", "MSFT", "AAPL"]
+    assert len(platform._quick_cache) == 1
+
+
+def test_quick_epv_requires_income_statements():
+    """Symbols without earnings should fail before reaching the calculator."""
+
+    def unexpected_calculation(**kwargs):
+        raise AssertionError("calculator should not run")
+
+    platform = make_quick_platform([], unexpected_calculation)
+
+    with pytest.raises(ValueError, match="No income statements"):
+        platform.quick_epv("ILLIQ")
+    assert len(platform._quick_cache) == 0
+
+
+def test_json_log_formatter_emits_one_object_per_record():
+    """Records should render as single-line JSON with the message interpolated."""
+    record = logging.LogRecord(
+        "src.main", logging.INFO, __file__, 1, "✓ %s: EPV=$%.2f", ("AAPL", 12.5), None
+    )
+
+    line = JsonLogFormatter().format(record)
+
+    assert "\n" not in line
+    assert orjson.loads(line) == {
+        "ts": record.created,
+        "lvl": "INFO",
+        "name": "src.main",
+        "msg": "✓ AAPL: EPV=$12.50",
+    }
@@ -0,0 +1,40 @@
+"""Unit tests for the API rate limiter."""
+
+import pytest
+
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import RateLimiter
+
+
+def test_reserve_queues_requests_past_the_limit():
+    """Requests beyond the per-minute cap should be given staggered slots."""
+    limiter = RateLimiter(requests_per_minute=2)
+
+    waits = [limiter._reserve() for _ in range(4)]
+
+    assert waits[:2] == [0.0, 0.0]
+    assert waits[2] == pytest.approx(60, abs=1)
+    assert waits[3] == pytest.approx(60, abs=1)
+    assert limiter.get_stats()["requests_this_minute"] == 4
+
+
+@pytest.mark.asyncio
+async def test_acquire_sleeps_without_blocking(monkeypatch):
+    """acquire() should wait via asyncio.sleep rather than time.sleep."""
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    def blocking_sleep(seconds):
+        raise AssertionError("event loop blocked")
+
+    monkeypatch.setattr(rate_limiter_module.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", blocking_sleep)
+    limiter = RateLimiter(requests_per_minute=1)
+
+    await limiter.acquire()
+    await limiter.acquire()
+
+    assert len(slept) == 1
+    assert slept[0] == pytest.approx(60, abs=1)
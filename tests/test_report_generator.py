@@ -0,0 +1,118 @@
+"""Unit tests for the PDF report generator, with WeasyPrint's HTML stubbed."""
+
+import importlib
+import multiprocessing
+import os
+import sys
+import types
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+
+class FakeHTML:
+    """Writes the rendered HTML, prefixed with the rendering process id."""
+
+    def __init__(self, string):
+        self.string = string
+
+    def write_pdf(self, path):
+        with open(path, "w") as f:
+            f.write(f"{os.getpid()}\n{self.string}")
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """
+    src.reports.generator, importable even where WeasyPrint is not.
+
+    WeasyPrint loads Pango when imported, so without its native libraries the
+    generator module cannot be imported at all; a stand-in weasyprint module
+    is used then and dropped again, with the generator, on teardown.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        try:
+            importlib.import_module("weasyprint")
+            stubbed = False
+        except OSError:
+            weasyprint = types.ModuleType("weasyprint")
+            weasyprint.HTML = FakeHTML
+            mp.setitem(sys.modules, "weasyprint", weasyprint)
+            stubbed = True
+        try:
+            yield importlib.import_module("src.reports.generator")
+        finally:
+            if stubbed:
+                del sys.modules["src.reports.generator"]
+                delattr(sys.modules["src.reports"], "generator")
+
+
+@pytest.fixture
+def pools(generator, monkeypatch):
+    """Stub HTML and record the max_workers of every process pool created."""
+    created = []
+
+    class RecordingPool(ProcessPoolExecutor):
+        def __init__(self, max_workers=None):
+            created.append(max_workers)
+            # Forked workers inherit the stubbed HTML
+            super().__init__(
+                max_workers=max_workers, mp_context=multiprocessing.get_context("fork")
+            )
+
+    monkeypatch.setattr(generator, "HTML", FakeHTML)
+    monkeypatch.setattr(generator, "ProcessPoolExecutor", RecordingPool)
+    return created
+
+
+def report_data(symbol):
+    return {
+        "symbol": symbol,
+        "title": f"{symbol} summary",
+        "stocks": [{"symbol": symbol, "company_name": f"{symbol} Inc."}],
+    }
+
+
+def rendered_by(path):
+    """The process id that wrote a stubbed PDF"""
+    with open(path) as f:
+        return int(f.readline())
+
+
+def test_build_reports_renders_single_item_inline(generator, pools, tmp_path):
+    """One report should render in this process, without starting a pool."""
+    paths = generator.build_reports(
+        [report_data("AAPL")], "summary.html", str(tmp_path)
+    )
+
+    assert paths == [str(tmp_path / "AAPL_report.pdf")]
+    assert pools == []
+    assert rendered_by(paths[0]) == os.getpid()
+
+
+def test_build_reports_uses_pool_in_input_order(generator, pools, tmp_path):
+    """A batch should render in worker processes, paths in input order."""
+    symbols = ["MSFT", "AAPL", "GOOG", "AMZN"]
+
+    paths = generator.build_reports(
+        [report_data(symbol) for symbol in symbols],
+        "summary.html",
+        str(tmp_path),
+        workers=2,
+    )
+
+    assert paths == [str(tmp_path / f"{symbol}_report.pdf") for symbol in symbols]
+    assert pools == [2]
+    assert os.getpid() not in {rendered_by(path) for path in paths}
+    with open(paths[0]) as f:
+        assert "MSFT Inc." in f.read()
+
+
+def test_template_is_parsed_once(generator, pools, tmp_path):
+    """Repeated renders should reuse the environment's cached Template."""
+    template = generator._TEMPLATE_ENV.get_template("summary.html")
+
+    for symbol in ("AAPL", "MSFT"):
+        generator.build_report(report_data(symbol), "summary.html", str(tmp_path))
+
+    assert generator._TEMPLATE_ENV.get_template("summary.html") is template
@@ -0,0 +1,64 @@
+"""Unit tests for research report exports."""
+
+import csv
+import io
+from datetime import date
+
+import orjson
+
+from src.analysis.research_generator import REPORT_EXPORT_COLUMNS, ResearchGenerator
+from src.models.financial_models import (
+    CompanyProfile,
+    EPVCalculation,
+    IncomeStatement,
+    ResearchReport,
+)
+
+
+def make_report():
+    epv = EPVCalculation(
+        symbol="AAPL",
+        calculation_date=date(2024, 6, 28),
+        normalized_earnings=100.0,
+        shares_outstanding=10.0,
+        cost_of_capital=0.1,
+        earnings_per_share=10.0,
+        epv_per_share=100.0,
+        epv_total=1000.0,
+        current_price=80.0,
+        margin_of_safety=0.25,
+    )
+    return ResearchReport(
+        symbol="AAPL",
+        company_name="Apple Inc.",
+        report_date=date(2024, 6, 28),
+        profile=CompanyProfile(symbol="AAPL", company_name="Apple Inc."),
+        income_statements=[
+            IncomeStatement(symbol="AAPL", period="annual", fiscal_year=2023)
+        ],
+        epv_calculation=epv,
+        recommendation="BUY",
+    )
+
+
+def test_export_json_serializes_nested_dataclasses():
+    """JSON exports should include nested statements and ISO dates."""
+    generator = ResearchGenerator.__new__(ResearchGenerator)
+
+    exported = orjson.loads(generator.export_report(make_report(), "json"))
+
+    assert exported["report_date"] == "2024-06-28"
+    assert exported["income_statements"][0]["fiscal_year"] == 2023
+    assert exported["epv_calculation"]["epv_per_share"] == 100.0
+
+
+def test_export_csv_summary_row():
+    """CSV exports should hold a header and one summary row."""
+    generator = ResearchGenerator.__new__(ResearchGenerator)
+
+    exported = generator.export_report(make_report(), "CSV").decode("utf-8")
+    rows = list(csv.reader(io.StringIO(exported)))
+
+    assert rows[0] == REPORT_EXPORT_COLUMNS
+    assert rows[1][:5] == ["AAPL", "Apple Inc.", "100.0", "80.0", "0.25"]
+    assert rows[1][7] == "BUY"
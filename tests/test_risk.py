@@ -2,9 +2,17 @@
 Tests for risk analysis functionality
 """
 
+import threading
+
 import pytest
 import numpy as np
-from src.analysis.risk import calc_risk, calc_portfolio_risk, calc_correlation_matrix
+from src.analysis.risk import (
+    calc_risk,
+    calc_portfolio_risk,
+    calc_correlation_matrix,
+    _fused_risk_stats,
+    _numpy_risk_stats,
+)
 
 
 class TestCalcRisk:
@@ -97,6 +105,46 @@ class TestCalcRisk:
         # Alpha (mean return) should be negative
         assert result["Alpha"] < 0
 
+    def test_calc_risk_var99_matches_lower_quantile(self):
+        """VaR99 should equal the 'lower' 1st percentile of simple returns"""
+        rng = np.random.default_rng(42)
+        prices = list(100.0 * np.cumprod(1.0 + rng.normal(0.0, 0.01, 500)))
+        result = calc_risk(prices)
+
+        prices_array = np.array(prices)
+        returns = np.diff(prices_array) / prices_array[:-1]
+        expected = np.quantile(returns, 0.01, method="lower")
+        assert result["VaR99"] == pytest.approx(expected)
+
+    def test_fused_stats_match_numpy_reference(self):
+        """Single-pass Welford kernel should agree with the vectorised path"""
+        rng = np.random.default_rng(7)
+        prices = 50.0 * np.cumprod(1.0 + rng.normal(0.0005, 0.02, 1000))
+
+        fused = _fused_risk_stats(prices)
+        reference = _numpy_risk_stats(prices)
+        assert fused == pytest.approx(reference, rel=1e-9)
+
+        result = calc_risk(list(prices))
+        assert (result["VaR99"], result["Sharpe"], result["Alpha"]) == pytest.approx(
+            reference, rel=1e-9
+        )
+
+    def test_calc_risk_cache_matches_uncached(self):
+        """Cached and uncached paths should return identical metrics"""
+        prices = [100.0, 101.5, 99.0, 102.0, 98.5, 105.0]
+
+        uncached = calc_risk(prices, use_cache=False)
+        assert calc_risk(prices) == uncached
+        assert calc_risk(prices) == uncached
+
+    def test_calc_risk_accepts_readonly_array(self):
+        """Byte-backed float64 arrays should match the list-based result"""
+        prices = [100.0, 101.0, 99.0, 102.0, 98.0, 105.0]
+        arr = np.frombuffer(np.array(prices, dtype="<f8").tobytes(), dtype="<f8")
+
+        assert calc_risk(arr, use_cache=False) == calc_risk(prices, use_cache=False)
+
 
 class TestCalcPortfolioRisk:
     """Test cases for calc_portfolio_risk function"""
@@ -237,3 +285,27 @@ class TestEdgeCases:
         assert "Sharpe" in result
         assert "Alpha" in result
         assert all(np.isfinite(v) for v in result.values())
+
+
+class TestRiskEndpoint:
+    """Test cases for the /risk/metrics handler"""
+
+    @pytest.mark.asyncio
+    async def test_metrics_computed_off_event_loop(self, monkeypatch):
+        """calc_risk should run in a worker thread, not on the event loop"""
+        from src.api.routers import risk as risk_router
+
+        threads = []
+
+        def fake_calc_risk(prices, use_cache=True):
+            threads.append(threading.get_ident())
+            return {"VaR99": 0.1, "Sharpe": 1.0, "Alpha": 0.0}
+
+        monkeypatch.setattr(risk_router, "calc_risk", fake_calc_risk)
+
+        response = await risk_router.calculate_risk_metrics(
+            risk_router.RiskRequest(prices=[100.0, 101.0, 99.0])
+        )
+
+        assert response.Sharpe == 1.0
+        assert threads and threads[0] != threading.get_ident()
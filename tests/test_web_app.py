@@ -0,0 +1,62 @@
+"""Unit tests for the batch results table paging."""
+
+from src.ui.web_app import batch_table_page, batch_table_rows, create_app
+
+
+def make_results(count):
+    return {
+        "results": {
+            f"S{i:03d}": {
+                "company_name": f"Company {i}",
+                "epv_per_share": float(i),
+                "current_price": 10.0 if i % 2 else None,
+                "margin_of_safety": None if i % 2 == 0 else float(100 - i),
+                "quality_score": 0.5,
+                "cost_of_capital": 0.1,
+            }
+            for i in range(count)
+        }
+        | {"BAD": {"error": "no data"}}
+    }
+
+
+def test_batch_table_page_slices_and_formats():
+    """Only the requested page should be formatted, failures left out."""
+    rows = batch_table_rows(make_results(60))
+
+    first = batch_table_page(rows, 0)
+    last = batch_table_page(rows, 2)
+
+    assert len(rows) == 60
+    assert len(first) == 25 and len(last) == 10
+    assert first[0] == {
+        "Symbol": "S000",
+        "Company": "Company 0",
+        "EPV": "$0.00",
+        "Current Price": "N/A",
+        "Margin of Safety": "N/A",
+        "Quality Score": "0.50",
+        "Cost of Capital": "10.00%",
+    }
+    assert last[-1]["Symbol"] == "S059"
+
+
+def test_batch_table_page_sorts_numerically_with_missing_last():
+    """Sorting should use raw values, not their formatted strings."""
+    rows = batch_table_rows(make_results(12))
+
+    by_epv = batch_table_page(rows, 0, [{"column_id": "EPV", "direction": "desc"}])
+    by_margin = batch_table_page(
+        rows, 0, [{"column_id": "Margin of Safety", "direction": "asc"}]
+    )
+
+    assert [row["EPV"] for row in by_epv[:3]] == ["$11.00", "$10.00", "$9.00"]
+    assert by_margin[0]["Margin of Safety"] == "89.0%"
+    assert [row["Margin of Safety"] for row in by_margin[6:]] == ["N/A"] * 6
+
+
+def test_create_app_registers_paging_callback():
+    """The app should build with the paging callback for the dynamic table."""
+    app = create_app(platform=None)
+
+    assert any("batch-results-table.data" in key for key in app.callback_map)